@@ -0,0 +1,11 @@
+-- Make call_summary.session_id unique so analytics sync can dedup with
+-- INSERT ... ON CONFLICT (session_id) DO NOTHING instead of a SELECT per session
+
+-- Drop duplicate summaries left by earlier concurrent syncs (keep the first)
+DELETE FROM call_summary a
+USING call_summary b
+WHERE a.session_id = b.session_id
+  AND a.id > b.id;
+
+DROP INDEX IF EXISTS idx_call_session;
+CREATE UNIQUE INDEX IF NOT EXISTS idx_call_session ON call_summary(session_id);
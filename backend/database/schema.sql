@@ -266,6 +266,101 @@ WHERE cs.call_date >= DATEADD(day, -7, CAST(GETDATE() AS DATE))
 GROUP BY cs.senior_id;
 GO
 
+-- ============================================
+-- TABLE TYPES + WRITE PROCEDURES (used by AnalyticsService)
+-- ============================================
+
+-- The whole per-call save is one procedure call; vitals and alerts arrive as
+-- table-valued parameters
+GO
+CREATE TYPE dbo.VitalRow AS TABLE (
+    vital_type VARCHAR(50) NOT NULL,
+    vital_value DECIMAL(10,2) NOT NULL,
+    unit VARCHAR(20) NOT NULL
+);
+
+CREATE TYPE dbo.AlertRow AS TABLE (
+    alert_type VARCHAR(50) NOT NULL,
+    severity VARCHAR(20) NOT NULL,
+    description VARCHAR(MAX) NOT NULL,
+    related_metric_value DECIMAL(10,2)
+);
+GO
+CREATE PROCEDURE dbo.usp_SaveCallAnalytics
+    @senior_id VARCHAR(50),
+    @session_id VARCHAR(50),
+    @call_date DATETIME2,
+    @call_duration INT,
+    @call_completed BIT,
+    @overall_wellness INT,
+    @summary_text VARCHAR(MAX),
+    @red_flags_count INT,
+    @red_flags NVARCHAR(MAX),
+    @cognitive_score INT, -- NULL = no cognitive assessment this call
+    @cognitive_notes VARCHAR(MAX),
+    @has_medication BIT, -- 0 = medication not discussed (no adherence row)
+    @medications_taken BIT,
+    @medications_missed_count INT,
+    @side_effects_reported BIT,
+    @side_effects_description VARCHAR(MAX),
+    @vitals dbo.VitalRow READONLY,
+    @alerts dbo.AlertRow READONLY
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+
+    -- Already saved: a retry after a lost commit acknowledgement must not
+    -- write the call twice
+    IF EXISTS (SELECT 1 FROM call_summary WHERE session_id = @session_id) RETURN;
+
+    BEGIN TRANSACTION;
+
+    INSERT INTO senior_vitals
+    (senior_id, recorded_at, vital_type, vital_value, unit, source, session_id)
+    SELECT @senior_id, @call_date, vital_type, vital_value, unit, 'call', @session_id
+    FROM @vitals;
+
+    IF @cognitive_score IS NOT NULL
+        INSERT INTO cognitive_assessments
+        (senior_id, assessment_date, overall_score, notes, session_id)
+        VALUES (@senior_id, @call_date, @cognitive_score, @cognitive_notes, @session_id);
+
+    INSERT INTO call_summary
+    (senior_id, call_date, session_id, call_duration, call_completed, call_answered,
+     overall_wellness, medication_adherence, medication_missed_count,
+     red_flags_count, red_flags, summary_text)
+    VALUES (@senior_id, @call_date, @session_id, @call_duration, @call_completed, 1,
+            @overall_wellness, @medications_taken, @medications_missed_count,
+            @red_flags_count, @red_flags, @summary_text);
+
+    IF @has_medication = 1
+        MERGE medication_adherence AS target
+        USING (SELECT @senior_id AS senior_id, CAST(@call_date AS DATE) AS log_date) AS source
+        ON (target.senior_id = source.senior_id AND target.log_date = source.log_date)
+        WHEN MATCHED THEN
+            UPDATE SET
+                medications_taken = @medications_taken,
+                medications_missed_count = @medications_missed_count,
+                side_effects_reported = @side_effects_reported,
+                side_effects_description = @side_effects_description,
+                session_id = @session_id
+        WHEN NOT MATCHED THEN
+            INSERT (senior_id, log_date, medications_taken, medications_missed_count,
+                    side_effects_reported, side_effects_description, session_id)
+            VALUES (source.senior_id, source.log_date, @medications_taken, @medications_missed_count,
+                    @side_effects_reported, @side_effects_description, @session_id);
+
+    INSERT INTO health_alerts
+    (senior_id, alert_date, alert_type, severity, description,
+     related_session_id, related_metric_value)
+    SELECT @senior_id, @call_date, alert_type, severity, description, @session_id, related_metric_value
+    FROM @alerts;
+
+    COMMIT TRANSACTION;
+END
+GO
+
 -- ============================================
 -- USEFUL QUERIES FOR DASHBOARD
 -- ============================================
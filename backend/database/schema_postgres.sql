@@ -87,7 +87,7 @@ CREATE TABLE IF NOT EXISTS call_summary (
 );
 
 CREATE INDEX IF NOT EXISTS idx_call_senior_date ON call_summary(senior_id, call_date);
-CREATE INDEX IF NOT EXISTS idx_call_session ON call_summary(session_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_call_session ON call_summary(session_id); -- One summary per session (sync dedup relies on it)
 CREATE INDEX IF NOT EXISTS idx_call_red_flags ON call_summary(red_flags_count, call_date);
 
 -- Table 4: Health Alerts (track concerning patterns)
@@ -95,6 +95,8 @@ try:
     print("  - vw_cognitive_trend_30d")
     print("  - vw_medication_adherence_weekly")
     print("  - vw_active_alerts_summary")
+    print(f"\nStored procedures created:")
+    print("  - usp_SaveCallAnalytics")
     print("="*60)
 
     cursor.close()
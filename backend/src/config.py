@@ -164,6 +164,9 @@ class Config:
             # Default fallback
             return 'Alex'
 
+    # Send only the core prompt plus the addenda for the current call phase
+    SENIOR_PROMPT_PHASED = os.getenv('SENIOR_PROMPT_PHASED', 'false').lower() == 'true'
+
     # Application settings
     DEBUG = os.getenv('DEBUG', 'True').lower() == 'true'
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
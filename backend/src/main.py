@@ -4,6 +4,7 @@ Local testing version (microphone/speaker based)
 """
 import sys
 import logging
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime, timedelta
 
@@ -16,7 +17,29 @@ from src.services.openai_service import OpenAIService
 from src.services.data_service import DataService
 from src.services.safety_service import safety_monitor, AlertLevel
 from src.services.cost_tracking_service import CostTrackingService
-from src.senior_health_prompt import SENIOR_HEALTH_SYSTEM_PROMPT
+from src.services.profile_service import SeniorProfileService
+from src.services.conversation_context_service import ConversationContextService
+from src.services.reminders_service import RemindersService
+from src.services.identity_verification_service import IdentityVerificationService
+from src.services.aws_connect_service import AWSConnectService
+from src.services.analytics_sync_service import AnalyticsSyncService
+from src.services.first_turn_cache import first_turn_cache
+from src.senior_health_prompt import (
+    COGNITIVE_SCORE_SCHEMA,
+    COGNITIVE_SCORING_RUBRIC,
+    CognitiveScores,
+    RESEARCH_TOOL_SCHEMA,
+    SENIOR_HEALTH_PROMPT_HASH,
+    SENIOR_HEALTH_PROMPT_TOKEN_ESTIMATE,
+    SENIOR_HEALTH_PROMPT_VERSION,
+    SENIOR_HEALTH_SYSTEM_PROMPT,
+    build_system_messages,
+    call_phase_for_turn,
+    classify_topic,
+    cohorts_for_conditions,
+    render_dynamic_context,
+    render_redirect_note,
+)
 import uuid
 from datetime import datetime
 
@@ -59,6 +82,8 @@ class SeniorHealthAgent:
             sys.exit(1)
 
         # Initialize OpenAI Service with Senior Health prompt
+        self.phased_prompt = config.SENIOR_PROMPT_PHASED
+        self.prompt_features = {"research"}
         try:
             self.openai = OpenAIService(
                 api_key=config.AZURE_OPENAI_KEY,
@@ -67,7 +92,9 @@ class SeniorHealthAgent:
                 api_version=config.AZURE_OPENAI_API_VERSION
             )
             self.openai.set_system_prompt(SENIOR_HEALTH_SYSTEM_PROMPT)
-            print("✅ OpenAI Service initialized with Senior Health prompt")
+            self.openai.set_tools([RESEARCH_TOOL_SCHEMA], self._handle_tool_call)
+            print(f"✅ OpenAI Service initialized with Senior Health prompt "
+                  f"{SENIOR_HEALTH_PROMPT_VERSION} ({SENIOR_HEALTH_PROMPT_HASH})")
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI Service: {e}")
             print(f"❌ OpenAI Service failed: {e}")
@@ -107,6 +134,16 @@ class SeniorHealthAgent:
         # Session management
         self.current_session_id = None
         self.senior_profile = {}
+        # Per-call context loaded by _load_senior_context (sent after the static prompt)
+        self.senior_history_context = ""
+        self.senior_reminders_context = ""
+        # Current call's rendered context and phase (phased prompt only)
+        self.call_dynamic_context = ""
+        self.call_phase = None
+        self.call_senior_name = None
+        self.call_ai_name = None
+        self.call_cohorts = ()
+        self.prompt_token_estimate = SENIOR_HEALTH_PROMPT_TOKEN_ESTIMATE
 
         print("\n✅ All services ready!\n")
         print("💡 Tip: Use menu option 4 to test service connections\n")
@@ -166,10 +203,10 @@ class SeniorHealthAgent:
             self.current_session_id = str(uuid.uuid4())
             return self.current_session_id
 
-    def save_message(self, role: str, content: str, metadata: dict = None):
-        """Save a message to the database with safety monitoring"""
+    def save_message(self, role: str, content: str, metadata: dict = None) -> dict:
+        """Save a message to the database with safety monitoring; returns the safety analysis"""
         if not self.current_session_id:
-            return
+            return None
 
         # Perform safety analysis
         safety_analysis = safety_monitor.analyze_message(content, role)
@@ -207,6 +244,8 @@ class SeniorHealthAgent:
             logger.error(f"Error saving message: {e}")
             # Continue even if save fails
 
+        return safety_analysis
+
     def _load_senior_context(self, phone_number: str) -> bool:
         """
         Load context from previous calls for this senior using phone number
@@ -217,9 +256,10 @@ class SeniorHealthAgent:
         Returns:
             True if context loaded successfully
         """
+        self.senior_history_context = ""
+        self.senior_reminders_context = ""
+        self.senior_profile = {}
         try:
-            from src.services.profile_service import SeniorProfileService
-
             # Initialize profile service
             profile_service = SeniorProfileService(
                 endpoint=config.AZURE_COSMOS_ENDPOINT,
@@ -234,6 +274,7 @@ class SeniorHealthAgent:
                 return False
 
             print(f"✅ Loaded profile")
+            self.senior_profile = profile
 
             # Get last few sessions for context
             sessions = profile['callHistory']['sessions'][-3:]  # Last 3 calls
@@ -285,7 +326,6 @@ class SeniorHealthAgent:
             context_summary = "\n".join(context_parts)
 
             # Add dynamic conversation context
-            from src.services.conversation_context_service import ConversationContextService
             context_service = ConversationContextService()
 
             # Build comprehensive context including temporal and historical info
@@ -297,24 +337,19 @@ class SeniorHealthAgent:
             # Load upcoming reminders from PostgreSQL
             reminders_context = ""
             try:
-                from src.services.reminders_service import RemindersService
                 reminders_service = RemindersService()
-                upcoming_reminders = reminders_service.get_upcoming_reminders(senior_id, days_ahead=7)
+                upcoming_reminders = reminders_service.get_upcoming_reminders(profile['seniorId'], days_ahead=7)
 
                 if upcoming_reminders:
-                    reminders_context = "\n\n" + reminders_service.format_reminders_for_context(upcoming_reminders)
+                    reminders_context = reminders_service.format_reminders_for_context(upcoming_reminders)
                     print(f"   ✅ Loaded {len(upcoming_reminders)} upcoming reminders")
             except Exception as reminder_error:
                 logger.warning(f"Could not load reminders: {reminder_error}")
 
-            # Combine profile context with dynamic context and reminders
-            full_context = context_summary + "\n\n" + dynamic_context + reminders_context
-
-            # Inject context into AI's conversation memory
-            self.openai.conversation_history.insert(0, {
-                "role": "system",
-                "content": full_context
-            })
+            # Keep context for the per-call message sent after the static prompt
+            # (see _apply_call_prompt) so the prompt prefix stays cacheable
+            self.senior_history_context = context_summary + "\n\n" + dynamic_context
+            self.senior_reminders_context = reminders_context
 
             print("   ✅ Context loaded into AI memory")
             print("   ✅ Dynamic conversation context added\n")
@@ -325,6 +360,155 @@ class SeniorHealthAgent:
             print(f"   ⚠️  Could not load context: {e}")
             return False
 
+    def _apply_call_prompt(self, senior_name: str, ai_name: str):
+        """
+        Send the static senior health prompt followed by this call's context
+
+        Args:
+            senior_name: Senior's first name (None if unknown)
+            ai_name: Name the AI introduces itself with
+        """
+        self.call_senior_name = senior_name
+        self.call_ai_name = ai_name
+        self.call_cohorts = cohorts_for_conditions(
+            self.senior_profile.get('medicalInformation', {}).get('conditions', [])
+        )
+        self.call_dynamic_context = render_dynamic_context(
+            senior_name=senior_name,
+            ai_name=ai_name,
+            history=self.senior_history_context,
+            reminders=self.senior_reminders_context
+        )
+        self.call_phase = call_phase_for_turn(1) if self.phased_prompt else None
+        self._send_system_messages()
+
+    def _send_system_messages(self):
+        """Send the static prompt (whole or for the current phase) and call context"""
+        self.openai.set_system_messages(build_system_messages(
+            self.call_dynamic_context,
+            phase=self.call_phase,
+            active_features=self.prompt_features,
+            cohorts=self.call_cohorts
+        ))
+        self.prompt_token_estimate = len(self.openai.system_prompt) // 4
+
+    def _update_call_phase(self, turn: int):
+        """
+        Switch the phased prompt's addenda when the call enters a new phase
+
+        Args:
+            turn: 1-based conversation turn about to be answered
+        """
+        if not self.phased_prompt:
+            return
+        phase = call_phase_for_turn(turn)
+        if phase != self.call_phase:
+            self.call_phase = phase
+            self._send_system_messages()
+            logger.info(f"Call phase: {phase}")
+
+    def _get_ai_response(self, user_text: str, turn: int, safety_analysis: dict, max_tokens: int):
+        """
+        Get the AI reply for a senior's turn
+
+        First-turn answers of calls without previous-call history or reminders are
+        answered from the shared first-turn cache when possible; only replies that
+        don't mention the senior's name are cached.
+
+        Args:
+            user_text: Senior's transcribed speech
+            turn: 1-based conversation turn
+            safety_analysis: save_message result for user_text
+            max_tokens: Maximum tokens in the reply
+
+        Returns:
+            (reply text or None, True if the reply came from the cache)
+        """
+        self._update_call_phase(turn)
+        system_note = safety_monitor.get_response_guidance(safety_analysis)
+        if not system_note:
+            off_topic = classify_topic(user_text)
+            if off_topic:
+                system_note = render_redirect_note(off_topic)
+
+        cacheable = (
+            turn == 1
+            and not system_note
+            and not self.senior_history_context
+            and not self.senior_reminders_context
+        )
+        prompt_key = f"{self.openai.system_prompt_hash}:{self.call_ai_name}:{','.join(self.call_cohorts)}"
+        if cacheable:
+            cached_response = first_turn_cache.get(prompt_key, user_text)
+            if cached_response:
+                self.openai.record_exchange(user_text, cached_response)
+                return cached_response, True
+
+        ai_response = self.openai.chat(user_text, temperature=0.7, max_tokens=max_tokens, system_note=system_note)
+
+        senior_name = (self.call_senior_name or "").lower()
+        if cacheable and ai_response and not (senior_name and senior_name in ai_response.lower()):
+            first_turn_cache.put(prompt_key, user_text, ai_response)
+        return ai_response, False
+
+    def _score_cognition(self, messages: list = None) -> dict:
+        """
+        Score the finished call's cognitive dimensions (structured model output)
+
+        Args:
+            messages: Transcript to score (defaults to the live conversation history)
+
+        Returns:
+            Dict of CognitiveScores fields, or None if the call could not be scored
+        """
+        raw_scores = self.openai.generate_cognitive_scores(COGNITIVE_SCORING_RUBRIC, COGNITIVE_SCORE_SCHEMA, messages)
+        if not raw_scores:
+            return None
+        try:
+            return CognitiveScores.model_validate_json(raw_scores).model_dump()
+        except ValueError as e:
+            logger.warning(f"Discarding invalid cognitive scores: {e}")
+            return None
+
+    def _handle_tool_call(self, name: str, arguments: dict) -> str:
+        """
+        Run a tool call made by the model
+
+        Args:
+            name: Tool name
+            arguments: Parsed tool arguments
+
+        Returns:
+            Result text passed back to the model
+        """
+        if name != "offer_research":
+            return f"Unknown tool: {name}"
+
+        # Imported here: the email SDK is optional and the task module starts a worker thread
+        from src.services.async_tasks_service import queue_research_email
+        from src.services.email_service import EmailService
+        from src.services.research_service import ResearchService
+
+        # Only ever the address on the profile - one mistranscribed character in a
+        # spoken address would send the senior's health topic to a stranger
+        recipient_email = self.senior_profile.get('email')
+        if not recipient_email:
+            return "No email address on file. Tell the senior their care team will follow up with the information."
+
+        search_types = {'doctor_search': 'doctors', 'education': 'educational', 'local_services': 'services'}
+        full_name = self.senior_profile.get('fullName') or ''
+        queue_research_email(
+            email_service=EmailService(),
+            research_service=ResearchService(),
+            recipient_email=recipient_email,
+            recipient_name=full_name.split()[0] if full_name else 'there',
+            research_topic=arguments['topic'],
+            search_query=arguments['topic'],
+            search_type=search_types.get(arguments.get('category'), 'educational')
+        )
+        print(f"   📧 Research email queued")
+        return "Research queued. The email will be sent within the hour."
+
     def _perform_identity_verification(self, phone_number: str) -> bool:
         """
         Perform identity verification using name and date of birth
@@ -337,9 +521,6 @@ class SeniorHealthAgent:
             True if identity verified successfully
         """
         try:
-            from src.services.profile_service import SeniorProfileService
-            from src.services.identity_verification_service import IdentityVerificationService
-
             print("\n🔐 IDENTITY VERIFICATION")
             print("   For your security, I need to verify your identity.")
 
@@ -452,8 +633,6 @@ class SeniorHealthAgent:
 
         # Initialize AWS Connect service and make the call
         try:
-            from src.services.aws_connect_service import AWSConnectService
-
             connect_service = AWSConnectService(
                 region=config.AWS_REGION,
                 instance_id=config.AWS_CONNECT_INSTANCE_ID,
@@ -492,7 +671,6 @@ class SeniorHealthAgent:
         senior_name = None
         senior_id = None
         try:
-            from src.services.profile_service import SeniorProfileService
             profile_service = SeniorProfileService(
                 endpoint=config.AZURE_COSMOS_ENDPOINT,
                 key=config.AZURE_COSMOS_KEY,
@@ -527,16 +705,8 @@ class SeniorHealthAgent:
         # Get AI name from voice configuration
         ai_name = config.get_ai_name()
 
-        # Update system prompt with senior's name - REPLACE placeholders in the prompt
-        if senior_name:
-            # Replace [Name] placeholder with actual senior name and [Your AI Name] with actual AI name
-            personalized_prompt = SENIOR_HEALTH_SYSTEM_PROMPT.replace("[Name]", senior_name).replace("[Your AI Name]", ai_name)
-            personalized_prompt += f"\n\nREMINDER: The senior's name is {senior_name}. Always use their actual name, never use placeholders like [Name]."
-            self.openai.set_system_prompt(personalized_prompt)
-        else:
-            # If no name, remove placeholders entirely
-            generic_prompt = SENIOR_HEALTH_SYSTEM_PROMPT.replace("[Name]", "them").replace("[Your AI Name]", ai_name)
-            self.openai.set_system_prompt(generic_prompt)
+        # Static prompt + this senior's name, history and reminders
+        self._apply_call_prompt(senior_name, ai_name)
 
         # Initial greeting (personalized if context loaded)
         if context_loaded and senior_name:
@@ -566,6 +736,7 @@ class SeniorHealthAgent:
         # Conversation loop with STRICT 5-minute time management
         ai_name = config.get_ai_name()  # Get AI name for conversation loop
         turn_count = 0
+        user_turns = 0  # Answered turns only; drives call phases and the first-turn cache
         conversation_start_time = datetime.now()
         time_warnings_given = {'4min30sec': False}
 
@@ -615,8 +786,9 @@ class SeniorHealthAgent:
                 print("⚠️  No speech detected. Please try again.")
                 continue
 
+            user_turns += 1
             print(f"👤 You: [suppressed]")
-            self.save_message("user", user_text)
+            safety_analysis = self.save_message("user", user_text)
 
             # Check for end conversation keywords (improved detection)
             exit_phrases = [
@@ -656,12 +828,13 @@ class SeniorHealthAgent:
                 break
 
             # Get AI response
-            ai_response = self.openai.chat(user_text, temperature=0.7, max_tokens=200)
+            ai_response, from_cache = self._get_ai_response(user_text, user_turns, safety_analysis, max_tokens=200)
 
             # Track OpenAI token usage (estimated based on text length)
-            if self.cost_tracker and ai_response:
+            if self.cost_tracker and ai_response and not from_cache:
                 # Rough estimation: ~4 chars per token for English text
-                input_tokens = len(user_text) // 4
+                # (the static system prompt is re-sent as input every turn)
+                input_tokens = self.prompt_token_estimate + len(user_text) // 4
                 output_tokens = len(ai_response) // 4
                 self.cost_tracker.track_openai_usage(input_tokens, output_tokens)
 
@@ -718,87 +891,83 @@ class SeniorHealthAgent:
         call_duration = int((datetime.now() - conversation_start_time).total_seconds())
 
         try:
-            call_summary = self.openai.generate_call_summary()
-            print(f"✅ Summary generated (content suppressed)\n")
-
-            # Save summary to Cosmos DB in the senior's profile
-            if phone_number and senior_name:
-                from src.services.profile_service import SeniorProfileService
-                profile_service = SeniorProfileService(
-                    endpoint=config.AZURE_COSMOS_ENDPOINT,
-                    key=config.AZURE_COSMOS_KEY,
-                    database_name=config.COSMOS_DATABASE
-                )
-                profile = profile_service.get_senior_by_phone(phone_number)
-                if profile:
-                    senior_id = profile['seniorId']
-                    # Add call record with summary
-                    call_metadata = {
-                        "duration": call_duration,
-                        "completed": True,
-                        "summary": call_summary
-                    }
-                    profile_service.add_call_record(senior_id, self.current_session_id, call_metadata)
-                    print(f"✅ Call summary saved to profile\n")
-
-                    # Save session metadata to Cosmos DB for easy transcript access
-                    try:
-                        session_metadata = {
-                            'senior_name': senior_name,
-                            'senior_id': senior_id,
-                            'phone_number': phone_number,
-                            'duration': call_duration,
-                            'summary': call_summary,
-                            'completed': True,
-                            'ai_name': config.get_ai_name(),
-                            'company_name': 'Seniorly'
+            # Release Cosmos/PostgreSQL clients even if finalize is interrupted
+            with ExitStack() as cleanup:
+                call_summary = self.openai.generate_call_summary()
+                print(f"✅ Summary generated (content suppressed)\n")
+
+                # Save summary to Cosmos DB in the senior's profile
+                if phone_number and senior_name:
+                    profile_service = SeniorProfileService(
+                        endpoint=config.AZURE_COSMOS_ENDPOINT,
+                        key=config.AZURE_COSMOS_KEY,
+                        database_name=config.COSMOS_DATABASE
+                    )
+                    cleanup.callback(profile_service.close)
+                    profile = profile_service.get_senior_by_phone(phone_number)
+                    if profile:
+                        senior_id = profile['seniorId']
+                        # Add call record with summary
+                        call_metadata = {
+                            "duration": call_duration,
+                            "completed": True,
+                            "summary": call_summary
                         }
-                        self.data.cosmos.add_session_metadata(self.current_session_id, session_metadata)
-                        print(f"✅ Session metadata saved (for transcript access)\n")
-                    except Exception as meta_error:
-                        print(f"⚠️  Failed to save session metadata: {meta_error}\n")
-
-                    # Sync conversation data to PostgreSQL analytics database
-                    print("📊 Syncing to PostgreSQL analytics database...")
-                    try:
-                        from src.services.analytics_sync_service import AnalyticsSyncService
-                        sync_service = AnalyticsSyncService()
-
-                        # Get the full session data from Cosmos DB
-                        session_data = {
-                            'sessionId': self.current_session_id,
-                            'createdAt': conversation_start_time.isoformat(),
-                            'messages': [],
-                            'metadata': {
-                                'senior_id': senior_id,
+                        profile_service.add_call_record(senior_id, self.current_session_id, call_metadata)
+                        print(f"✅ Call summary saved to profile\n")
+
+                        # Save session metadata to Cosmos DB for easy transcript access
+                        try:
+                            session_metadata = {
                                 'senior_name': senior_name,
+                                'senior_id': senior_id,
                                 'phone_number': phone_number,
-                                'call_duration': call_duration,
+                                'duration': call_duration,
                                 'summary': call_summary,
-                                'call_completed': True
+                                'completed': True,
+                                'ai_name': config.get_ai_name(),
+                                'company_name': 'Seniorly',
+                                'prompt_version': SENIOR_HEALTH_PROMPT_VERSION,
+                                'prompt_hash': self.openai.system_prompt_hash
+                            }
+                            self.data.cosmos.add_session_metadata(self.current_session_id, session_metadata)
+                            print(f"✅ Session metadata saved (for transcript access)\n")
+                        except Exception as meta_error:
+                            print(f"⚠️  Failed to save session metadata: {meta_error}\n")
+
+                        # Sync conversation data to PostgreSQL analytics database
+                        print("📊 Syncing to PostgreSQL analytics database...")
+                        try:
+                            # Imported here: the task module starts its worker threads on import
+                            from src.services.async_tasks_service import queue_analytics_sync
+
+                            sync_service = AnalyticsSyncService()
+
+                            # Get the full session data from Cosmos DB
+                            # Messages are passed through as-is; sync falls back to
+                            # createdAt for messages without their own timestamp
+                            session_data = {
+                                'sessionId': self.current_session_id,
+                                'createdAt': conversation_start_time.isoformat(),
+                                'messages': list(self.openai.full_conversation_history),
+                                'metadata': {
+                                    'senior_id': senior_id,
+                                    'senior_name': senior_name,
+                                    'phone_number': phone_number,
+                                    'call_duration': call_duration,
+                                    'summary': call_summary,
+                                    'call_completed': True
+                                }
                             }
-                        }
-
-                        # Add messages to session data
-                        for msg in self.openai.full_conversation_history:
-                            session_data['messages'].append({
-                                'role': msg['role'],
-                                'content': msg['content'],
-                                'timestamp': conversation_start_time.isoformat(),
-                                'metadata': {}
-                            })
-
-                        # Sync to PostgreSQL
-                        success = sync_service.sync_conversation(session_data)
 
-                        if success:
-                            print(f"✅ Analytics data synced to PostgreSQL\n")
-                        else:
-                            print(f"⚠️  Failed to sync analytics data\n")
+                            # Score cognition and sync to PostgreSQL in the background (a
+                            # re-run is harmless: already-synced sessions are skipped by ON CONFLICT)
+                            queue_analytics_sync(sync_service, session_data, score_cognition=self._score_cognition)
+                            print(f"✅ Analytics sync queued\n")
 
-                    except Exception as analytics_error:
-                        print(f"⚠️  PostgreSQL sync failed: {analytics_error}\n")
-                        # Don't fail the whole call if analytics fails
+                        except Exception as analytics_error:
+                            print(f"⚠️  PostgreSQL sync failed: {analytics_error}\n")
+                            # Don't fail the whole call if analytics fails
 
         except Exception as e:
             print(f"⚠️  Could not generate/save summary: {e}\n")
@@ -850,14 +1019,19 @@ class SeniorHealthAgent:
                 print("\n👋 Goodbye!")
                 break
 
-            self.save_message("user", user_input)
+            safety_analysis = self.save_message("user", user_input)
 
             # Get AI response
-            ai_response = self.openai.chat(user_input, temperature=0.7, max_tokens=200)
+            ai_response = self.openai.chat(
+                user_input,
+                temperature=0.7,
+                max_tokens=200,
+                system_note=safety_monitor.get_response_guidance(safety_analysis)
+            )
 
             # Track OpenAI token usage (estimated)
             if self.cost_tracker and ai_response:
-                input_tokens = len(user_input) // 4
+                input_tokens = self.prompt_token_estimate + len(user_input) // 4
                 output_tokens = len(ai_response) // 4
                 self.cost_tracker.track_openai_usage(input_tokens, output_tokens)
 
@@ -889,8 +1063,6 @@ class SeniorHealthAgent:
             return
 
         try:
-            from src.services.aws_connect_service import AWSConnectService
-
             print(f"\n📞 Initiating call to: {phone_number}")
             print("⚠️  This will make a real phone call using AWS Connect!")
 
@@ -3,14 +3,131 @@ Analytics Service
 Extracts metrics from call summaries and stores in Azure SQL for dashboard analytics
 """
 import pyodbc
+import json
 import logging
+import queue
 import re
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import chain
+from typing import Dict, List, Optional, Any, Tuple
+from datetime import datetime, timezone
 from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Let the ODBC driver manager reuse connections too (must be set before the first connect)
+pyodbc.pooling = True
+
+# Vital sign patterns used by _extract_vitals, fused into one regex so the
+# text is scanned once; the outer group name says which vital matched
+_VITAL_PATTERNS = [
+    # Blood pressure: "120/80", "blood pressure 135 over 85", "BP: 140/90"
+    ('bp', r'(?:blood pressure|BP|bp)[:\s]+(?P<bp_sys>\d{2,3})[/\s]*(?:over|/)?\s*(?P<bp_dia>\d{2,3})'),
+    # Heart rate: "heart rate 72", "pulse 68 bpm", "HR: 75"
+    ('hr', r'(?:heart rate|pulse|HR)[:\s]+(?P<hr_value>\d{2,3})'),
+    # Weight: "weight 165 pounds", "weighs 170 lbs", "weight: 68 kg"
+    ('weight', r'weigh[ts]*[:\s]+(?P<weight_value>\d{2,3})\s*(?P<weight_unit>lbs|pounds|kg)'),
+    # Blood sugar: "blood sugar 95", "glucose 110 mg/dL"
+    ('glucose', r'(?:blood sugar|glucose)[:\s]+(?P<glucose_value>\d{2,3})'),
+    # Sleep hours: "slept 7 hours", "sleep: 8.5 hours", "got 6 hours of sleep"
+    ('sleep', r'(?:slept|sleep|got)[:\s]+(?P<sleep_value>\d+\.?\d*)\s*hours?'),
+    # Pain level: "pain level 5", "pain: 3 out of 10", "rate pain 7/10"
+    ('pain', r'pain[:\s]+(?P<pain_value>\d{1,2})'),
+]
+_VITALS_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _VITAL_PATTERNS),
+    re.IGNORECASE
+)
+
+# Keyword tuples for the cognitive, wellness and alert heuristics (built once at
+# import), matched in a single pass over the lowercased text by _count_keywords
+_KEYWORD_CATEGORIES = {
+    'memory': ('memory', 'remember', 'recall', 'forgot', 'forgetful'),
+    'confusion': ('confused', 'disoriented', 'unclear', 'lost track'),
+    'coherence': ('coherent', 'clear', 'lucid', 'oriented'),
+    'positive': ('good', 'great', 'well', 'better', 'fine', 'excellent'),
+    'negative': ('bad', 'poor', 'worse', 'not well', 'sick', 'pain'),
+    'emergency': ('emergency', 'urgent', 'severe pain', 'chest pain', 'can\'t breathe', 'fell', 'fall'),
+    'isolation': ('lonely', 'alone', 'no one to talk', 'isolated', 'depressed'),
+}
+_KEYWORD_TO_CATEGORY = {kw: category for category, keywords in _KEYWORD_CATEGORIES.items() for kw in keywords}
+# Zero-width lookahead so keywords nested inside others ('well' in 'not well',
+# 'clear' in 'unclear') are still found, matching the old `kw in text` checks
+_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in sorted(_KEYWORD_TO_CATEGORY, key=len, reverse=True)) + "))"
+)
+
+# Emergency and isolation keywords in one alternation, so _detect_health_alerts
+# can stop scanning as soon as both alert kinds have been seen
+_ALERT_KEYWORD_RE = re.compile(
+    "(?=(?P<emergency>" + "|".join(map(re.escape, _KEYWORD_CATEGORIES['emergency'])) + ")"
+    "|(?P<isolation>" + "|".join(map(re.escape, _KEYWORD_CATEGORIES['isolation'])) + "))"
+)
+
+# Whole-word sentiment matchers for _extract_wellness_scores, which counts every
+# mention (so "felt good, slept well" outweighs a single "good")
+_POSITIVE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _KEYWORD_CATEGORIES['positive'])) + r")\b")
+_NEGATIVE_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, _KEYWORD_CATEGORIES['negative'])) + r")\b")
+
+
+def _count_keywords(text: str) -> Counter:
+    """
+    Count how many distinct keywords of each category appear in lowercased text
+
+    Returns Counter like {'memory': 2, 'positive': 1}
+    """
+    found = {match.group(1) for match in _KEYWORD_RE.finditer(text)}
+    return Counter(_KEYWORD_TO_CATEGORY[kw] for kw in found)
+
+# Azure SQL errors worth retrying: 40501 service busy, 40613 database unavailable,
+# 40197 failover in progress, 49918-49920 not enough resources, 4060/10928/10929 limits
+_TRANSIENT_SQL_ERRORS = ('40501', '40613', '40197', '49918', '49919', '49920', '4060', '10928', '10929')
+
+
+def _is_transient_sql_error(error: Exception) -> bool:
+    """True if a pyodbc error is a dropped connection or Azure SQL throttling"""
+    if isinstance(error, pyodbc.OperationalError):
+        return True
+    message = str(error)
+    return any(f"({code})" in message for code in _TRANSIENT_SQL_ERRORS)
+
+
+class _ConnectionPool:
+    """Thread-safe pool of Azure SQL connections, opened lazily up to max_size"""
+
+    def __init__(self, connection_string: str, max_size: int):
+        self.connection_string = connection_string
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_size)
+
+    @contextmanager
+    def borrow(self):
+        """Borrow a connection; it goes back to the pool unless the caller raised"""
+        self._slots.acquire()
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = pyodbc.connect(self.connection_string, autocommit=False)
+
+            try:
+                yield conn
+            except Exception:
+                # The connection may be broken mid-transaction - don't reuse it
+                try:
+                    conn.close()
+                except pyodbc.Error:
+                    pass
+                raise
+
+            self._idle.put(conn)
+        finally:
+            self._slots.release()
+
 
 class AnalyticsService:
     """
@@ -18,6 +135,17 @@ class AnalyticsService:
     and stores them in Azure SQL for analytics and dashboards
     """
 
+    # Connections kept open to Azure SQL (saves the TLS + auth handshake per call)
+    POOL_SIZE = 4
+    # Background threads performing the saves
+    SAVE_WORKERS = 2
+    # Upper bound on the summary + transcript text scanned for vitals
+    MAX_SCAN_CHARS = 65536
+    # Retries for transient Azure SQL failures (throttling, failover), with exponential backoff
+    SAVE_ATTEMPTS = 4
+    SAVE_RETRY_BASE_DELAY = 0.2
+    SAVE_RETRY_MAX_DELAY = 3.0
+
     def __init__(self, connection_string: str = None):
         """
         Initialize Analytics Service
@@ -45,11 +173,11 @@ class AnalyticsService:
                 f"Connection Timeout=30;"
             )
 
-        logger.info("Analytics Service initialized")
+        self._pool = _ConnectionPool(self.connection_string, self.POOL_SIZE)
+        # Database writes run off the call-completion path
+        self._executor = ThreadPoolExecutor(max_workers=self.SAVE_WORKERS, thread_name_prefix="analytics-save")
 
-    def _get_connection(self):
-        """Get database connection"""
-        return pyodbc.connect(self.connection_string)
+        logger.info("Analytics Service initialized")
 
     def extract_and_save_metrics(
         self,
@@ -63,6 +191,9 @@ class AnalyticsService:
         """
         Extract all metrics from a completed call and save to analytics database
 
+        Extraction runs inline; the database write runs on a background worker
+        so call teardown doesn't wait on Azure SQL
+
         Args:
             senior_id: Senior's ID
             session_id: Call session ID
@@ -72,46 +203,96 @@ class AnalyticsService:
             call_completed: Whether call completed successfully
 
         Returns:
-            True if successful
+            True if metrics were extracted and queued for saving
         """
         try:
-            # Extract metrics from summary and conversation
-            vitals = self._extract_vitals(call_summary, conversation_history)
-            cognitive = self._extract_cognitive_metrics(call_summary, conversation_history)
-            wellness = self._extract_wellness_scores(call_summary)
-            medication = self._extract_medication_info(call_summary, conversation_history)
-            alerts = self._detect_health_alerts(call_summary, vitals, cognitive)
-
-            call_date = datetime.utcnow()
-
-            # Save to database
-            conn = self._get_connection()
-            cursor = conn.cursor()
-
-            # 1. Save vitals
-            if vitals:
-                self._save_vitals(cursor, senior_id, session_id, call_date, vitals)
-
-            # 2. Save cognitive assessment
-            if cognitive:
-                self._save_cognitive_assessment(cursor, senior_id, session_id, call_date, cognitive)
-
-            # 3. Save call summary
-            self._save_call_summary(
-                cursor, senior_id, session_id, call_date,
-                call_duration, call_completed, wellness, medication, call_summary, alerts
+            metrics = self.extract_metrics(call_summary, conversation_history)
+            call_date = datetime.now(timezone.utc)
+
+            self._executor.submit(
+                self._persist, senior_id, session_id, call_date,
+                call_duration, call_completed, call_summary, metrics
             )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error extracting analytics: {e}")
+            return False
+
+    def extract_metrics(self, call_summary: str, conversation_history: List[Dict]) -> Dict[str, Any]:
+        """
+        Extract all metrics from a completed call (no database access)
+
+        Returns dict with vitals, cognitive, wellness, medication and alerts
+        """
+        # Extract metrics from summary and conversation (transcript joined once)
+        full_text = self._scan_window(call_summary, conversation_history)
+        vitals = self._extract_vitals(full_text)
+
+        # The summary heuristics all work on lowercase text - lowercase it once
+        summary_lower = call_summary.lower()
+        cognitive = self._extract_cognitive_metrics(call_summary, summary_lower)
+
+        return {
+            'vitals': vitals,
+            'cognitive': cognitive,
+            'wellness': self._extract_wellness_scores(summary_lower),
+            'medication': self._extract_medication_info(call_summary, summary_lower),
+            'alerts': self._detect_health_alerts(summary_lower, vitals, cognitive),
+        }
+
+    def _scan_window(self, call_summary: str, conversation_history: List[Dict]) -> str:
+        """
+        Join the summary with the most recent messages that fit in MAX_SCAN_CHARS
 
-            # 4. Save medication adherence
-            if medication:
-                self._save_medication_adherence(cursor, senior_id, session_id, call_date, medication)
+        Readings are local phrases, so a bounded window keeps extraction time
+        flat on very long calls; kept messages stay in chronological order
+        """
+        budget = self.MAX_SCAN_CHARS - len(call_summary)
+        recent = []
+        for msg in reversed(conversation_history):
+            content = msg['content']
+            budget -= len(content) + 1
+            if budget < 0:
+                break
+            recent.append(content)
+
+        return " ".join(chain([call_summary], reversed(recent)))
+
+    def _persist(
+        self, senior_id: str, session_id: str, call_date: datetime,
+        call_duration: int, call_completed: bool, call_summary: str, metrics: Dict[str, Any]
+    ) -> bool:
+        """Save extracted metrics to the analytics database (runs on the background worker)"""
+        vitals = metrics['vitals']
+        cognitive = metrics['cognitive']
+        medication = metrics['medication']
+        alerts = metrics['alerts']
+        # call_summary.red_flags is a JSON array of alert types
+        red_flags = json.dumps([a['alert_type'] for a in alerts], separators=(',', ':')) if alerts else None
 
-            # 5. Save health alerts
-            if alerts:
-                self._save_health_alerts(cursor, senior_id, session_id, call_date, alerts)
+        try:
+            # Save to database: one stored procedure call writes every table
+            # in a single round-trip and transaction
+            sql, params = self._save_call_analytics(
+                senior_id, session_id, call_date, call_duration, call_completed, call_summary,
+                vitals, cognitive, metrics['wellness'], medication, alerts, red_flags
+            )
 
-            conn.commit()
-            conn.close()
+            for attempt in range(1, self.SAVE_ATTEMPTS + 1):
+                try:
+                    with self._pool.borrow() as conn:
+                        cursor = conn.cursor()
+                        cursor.execute(sql, *params)
+                        conn.commit()
+                    break
+                except pyodbc.Error as e:
+                    if attempt == self.SAVE_ATTEMPTS or not _is_transient_sql_error(e):
+                        raise
+                    # The failed connection was dropped by the pool; retry on a fresh one
+                    delay = min(self.SAVE_RETRY_BASE_DELAY * 2 ** (attempt - 1), self.SAVE_RETRY_MAX_DELAY)
+                    logger.warning(f"⚠️  Transient Azure SQL error (attempt {attempt}/{self.SAVE_ATTEMPTS}), retrying in {delay:.1f}s: {e}")
+                    time.sleep(delay)
 
             logger.info(f"Successfully saved analytics for senior {senior_id}, session {session_id}")
             return True
@@ -120,9 +301,14 @@ class AnalyticsService:
             logger.error(f"Error saving analytics: {e}")
             return False
 
-    def _extract_vitals(self, summary: str, conversation: List[Dict]) -> Dict[str, Dict]:
+    def shutdown(self, wait: bool = True):
+        """Stop accepting saves; by default wait for queued saves to finish"""
+        self._executor.shutdown(wait=wait)
+        logger.info("🛑 Analytics save worker stopped")
+
+    def _extract_vitals(self, full_text: str) -> Dict[str, Dict]:
         """
-        Extract vital signs from conversation
+        Extract vital signs from the summary + conversation text
 
         Returns dict like:
         {
@@ -132,50 +318,28 @@ class AnalyticsService:
         """
         vitals = {}
 
-        # Combine summary and conversation text
-        full_text = summary + " " + " ".join([msg['content'] for msg in conversation])
-
-        # Blood pressure pattern: "120/80", "blood pressure 135 over 85", "BP: 140/90"
-        bp_pattern = r'(?:blood pressure|BP|bp)[:\s]+(\d{2,3})[/\s]*(?:over|/)?\s*(\d{2,3})'
-        bp_match = re.search(bp_pattern, full_text, re.IGNORECASE)
-        if bp_match:
-            vitals['bp_systolic'] = {'value': int(bp_match.group(1)), 'unit': 'mmHg'}
-            vitals['bp_diastolic'] = {'value': int(bp_match.group(2)), 'unit': 'mmHg'}
-
-        # Heart rate: "heart rate 72", "pulse 68 bpm", "HR: 75"
-        hr_pattern = r'(?:heart rate|pulse|HR)[:\s]+(\d{2,3})'
-        hr_match = re.search(hr_pattern, full_text, re.IGNORECASE)
-        if hr_match:
-            vitals['heart_rate'] = {'value': int(hr_match.group(1)), 'unit': 'bpm'}
-
-        # Weight: "weight 165 pounds", "weighs 170 lbs", "weight: 68 kg"
-        weight_pattern = r'weigh[ts]*[:\s]+(\d{2,3})\s*(lbs|pounds|kg)'
-        weight_match = re.search(weight_pattern, full_text, re.IGNORECASE)
-        if weight_match:
-            unit = 'lbs' if 'lb' in weight_match.group(2).lower() or 'pound' in weight_match.group(2).lower() else 'kg'
-            vitals['weight'] = {'value': int(weight_match.group(1)), 'unit': unit}
-
-        # Blood sugar: "blood sugar 95", "glucose 110 mg/dL"
-        glucose_pattern = r'(?:blood sugar|glucose)[:\s]+(\d{2,3})'
-        glucose_match = re.search(glucose_pattern, full_text, re.IGNORECASE)
-        if glucose_match:
-            vitals['blood_sugar'] = {'value': int(glucose_match.group(1)), 'unit': 'mg/dL'}
-
-        # Sleep hours: "slept 7 hours", "sleep: 8.5 hours", "got 6 hours of sleep"
-        sleep_pattern = r'(?:slept|sleep|got)[:\s]+(\d+\.?\d*)\s*hours?'
-        sleep_match = re.search(sleep_pattern, full_text, re.IGNORECASE)
-        if sleep_match:
-            vitals['sleep_hours'] = {'value': float(sleep_match.group(1)), 'unit': 'hours'}
-
-        # Pain level: "pain level 5", "pain: 3 out of 10", "rate pain 7/10"
-        pain_pattern = r'pain[:\s]+(\d{1,2})'
-        pain_match = re.search(pain_pattern, full_text, re.IGNORECASE)
-        if pain_match:
-            vitals['pain_level'] = {'value': int(pain_match.group(1)), 'unit': 'scale'}
+        # One pass; the first reading of each kind wins
+        for match in _VITALS_RE.finditer(full_text):
+            kind = match.lastgroup
+            if kind == 'bp' and 'bp_systolic' not in vitals:
+                vitals['bp_systolic'] = {'value': int(match.group('bp_sys')), 'unit': 'mmHg'}
+                vitals['bp_diastolic'] = {'value': int(match.group('bp_dia')), 'unit': 'mmHg'}
+            elif kind == 'hr' and 'heart_rate' not in vitals:
+                vitals['heart_rate'] = {'value': int(match.group('hr_value')), 'unit': 'bpm'}
+            elif kind == 'weight' and 'weight' not in vitals:
+                weight_unit = match.group('weight_unit').lower()
+                unit = 'lbs' if 'lb' in weight_unit or 'pound' in weight_unit else 'kg'
+                vitals['weight'] = {'value': int(match.group('weight_value')), 'unit': unit}
+            elif kind == 'glucose' and 'blood_sugar' not in vitals:
+                vitals['blood_sugar'] = {'value': int(match.group('glucose_value')), 'unit': 'mg/dL'}
+            elif kind == 'sleep' and 'sleep_hours' not in vitals:
+                vitals['sleep_hours'] = {'value': float(match.group('sleep_value')), 'unit': 'hours'}
+            elif kind == 'pain' and 'pain_level' not in vitals:
+                vitals['pain_level'] = {'value': int(match.group('pain_value')), 'unit': 'scale'}
 
         return vitals
 
-    def _extract_cognitive_metrics(self, summary: str, conversation: List[Dict]) -> Optional[Dict]:
+    def _extract_cognitive_metrics(self, summary: str, summary_lower: str) -> Optional[Dict]:
         """
         Extract cognitive health indicators from conversation patterns
 
@@ -184,17 +348,15 @@ class AnalyticsService:
         # This is a simplified version - in production, use more sophisticated NLP
         cognitive = {}
 
-        full_text = summary.lower()
+        full_text = summary_lower
 
         # Look for cognitive keywords in summary
-        memory_keywords = ['memory', 'remember', 'recall', 'forgot', 'forgetful']
-        confusion_keywords = ['confused', 'disoriented', 'unclear', 'lost track']
-        coherence_keywords = ['coherent', 'clear', 'lucid', 'oriented']
+        counts = _count_keywords(full_text)
 
         # Basic scoring (in production, use actual conversation analysis)
-        memory_mentions = sum(1 for kw in memory_keywords if kw in full_text)
-        confusion_mentions = sum(1 for kw in confusion_keywords if kw in full_text)
-        coherence_mentions = sum(1 for kw in coherence_keywords if kw in full_text)
+        memory_mentions = counts['memory']
+        confusion_mentions = counts['confusion']
+        coherence_mentions = counts['coherence']
 
         if memory_mentions > 0 or confusion_mentions > 0 or coherence_mentions > 0:
             # Simple heuristic scoring (0-100)
@@ -211,22 +373,19 @@ class AnalyticsService:
 
         return cognitive if cognitive else None
 
-    def _extract_wellness_scores(self, summary: str) -> Dict[str, int]:
+    def _extract_wellness_scores(self, summary_lower: str) -> Dict[str, int]:
         """
-        Extract wellness scores from summary
+        Extract wellness scores from the lowercased summary
 
         Returns dict with wellness scores (1-10 scale)
         """
         wellness = {}
 
-        # Look for sentiment indicators
-        positive_keywords = ['good', 'great', 'well', 'better', 'fine', 'excellent']
-        negative_keywords = ['bad', 'poor', 'worse', 'not well', 'sick', 'pain']
+        # Look for sentiment indicators (every whole-word mention counts)
+        full_text = summary_lower
 
-        full_text = summary.lower()
-
-        positive_count = sum(1 for kw in positive_keywords if kw in full_text)
-        negative_count = sum(1 for kw in negative_keywords if kw in full_text)
+        positive_count = len(_POSITIVE_RE.findall(full_text))
+        negative_count = len(_NEGATIVE_RE.findall(full_text))
 
         # Simple heuristic (in production, use sentiment analysis model)
         base_wellness = 7
@@ -237,13 +396,13 @@ class AnalyticsService:
 
         return wellness
 
-    def _extract_medication_info(self, summary: str, conversation: List[Dict]) -> Optional[Dict]:
+    def _extract_medication_info(self, summary: str, summary_lower: str) -> Optional[Dict]:
         """
         Extract medication adherence information
 
         Returns dict with medication info
         """
-        full_text = summary.lower()
+        full_text = summary_lower
 
         medication = {}
 
@@ -267,7 +426,7 @@ class AnalyticsService:
 
     def _detect_health_alerts(
         self,
-        summary: str,
+        summary_lower: str,
         vitals: Dict,
         cognitive: Optional[Dict]
     ) -> List[Dict]:
@@ -277,7 +436,13 @@ class AnalyticsService:
         Returns list of alert dicts
         """
         alerts = []
-        full_text = summary.lower()
+
+        # One scan of the summary for both alert kinds, stopping once both are found
+        alert_kinds = set()
+        for match in _ALERT_KEYWORD_RE.finditer(summary_lower):
+            alert_kinds.add(match.lastgroup)
+            if len(alert_kinds) == 2:
+                break
 
         # Check vital abnormalities
         if 'bp_systolic' in vitals:
@@ -307,8 +472,7 @@ class AnalyticsService:
             })
 
         # Check for emergency keywords
-        emergency_keywords = ['emergency', 'urgent', 'severe pain', 'chest pain', 'can\'t breathe', 'fell', 'fall']
-        if any(kw in full_text for kw in emergency_keywords):
+        if 'emergency' in alert_kinds:
             alerts.append({
                 'alert_type': 'emergency',
                 'severity': 'critical',
@@ -317,8 +481,7 @@ class AnalyticsService:
             })
 
         # Check for isolation indicators
-        isolation_keywords = ['lonely', 'alone', 'no one to talk', 'isolated', 'depressed']
-        if any(kw in full_text for kw in isolation_keywords):
+        if 'isolation' in alert_kinds:
             alerts.append({
                 'alert_type': 'isolation_detected',
                 'severity': 'medium',
@@ -328,86 +491,33 @@ class AnalyticsService:
 
         return alerts
 
-    def _save_vitals(self, cursor, senior_id: str, session_id: str, call_date: datetime, vitals: Dict):
-        """Save vitals to database"""
-        for vital_type, data in vitals.items():
-            cursor.execute("""
-                INSERT INTO senior_vitals
-                (senior_id, recorded_at, vital_type, vital_value, unit, source, session_id)
-                VALUES (?, ?, ?, ?, ?, 'call', ?)
-            """, senior_id, call_date, vital_type, data['value'], data['unit'], session_id)
-
-    def _save_cognitive_assessment(self, cursor, senior_id: str, session_id: str, call_date: datetime, cognitive: Dict):
-        """Save cognitive assessment to database"""
-        cursor.execute("""
-            INSERT INTO cognitive_assessments
-            (senior_id, assessment_date, overall_score, notes, session_id)
-            VALUES (?, ?, ?, ?, ?)
-        """, senior_id, call_date, cognitive.get('overall_score'), cognitive.get('notes'), session_id)
-
-    def _save_call_summary(
-        self, cursor, senior_id: str, session_id: str, call_date: datetime,
-        call_duration: int, call_completed: bool, wellness: Dict, medication: Optional[Dict],
-        summary_text: str, alerts: List[Dict]
-    ):
-        """Save call summary to database"""
-        cursor.execute("""
-            INSERT INTO call_summary
-            (senior_id, call_date, session_id, call_duration, call_completed, call_answered,
-             overall_wellness, medication_adherence, medication_missed_count,
-             red_flags_count, red_flags, summary_text)
-            VALUES (?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?)
-        """,
-            senior_id, call_date, session_id, call_duration, call_completed,
+    def _save_call_analytics(
+        self, senior_id: str, session_id: str, call_date: datetime,
+        call_duration: int, call_completed: bool, summary_text: str,
+        vitals: Dict, cognitive: Optional[Dict], wellness: Dict, medication: Optional[Dict],
+        alerts: List[Dict], red_flags: Optional[str]
+    ) -> Tuple[str, List]:
+        """Build the usp_SaveCallAnalytics call (vitals and alerts passed as TVPs)"""
+        vital_rows = [(vital_type, float(data['value']), data['unit']) for vital_type, data in vitals.items()]
+        alert_rows = [
+            (alert['alert_type'], alert['severity'], alert['description'], alert.get('related_metric_value'))
+            for alert in alerts
+        ]
+        medication = medication or {}
+
+        return "{CALL dbo.usp_SaveCallAnalytics(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)}", [
+            senior_id, session_id, call_date, call_duration, call_completed,
             wellness.get('overall_wellness'),
-            medication.get('medications_taken') if medication else None,
-            medication.get('medications_missed_count', 0) if medication else 0,
+            summary_text,
             len(alerts),
-            str([a['alert_type'] for a in alerts]) if alerts else None,
-            summary_text
-        )
-
-    def _save_medication_adherence(self, cursor, senior_id: str, session_id: str, call_date: datetime, medication: Dict):
-        """Save medication adherence to database"""
-        cursor.execute("""
-            MERGE medication_adherence AS target
-            USING (SELECT ? AS senior_id, ? AS log_date) AS source
-            ON (target.senior_id = source.senior_id AND target.log_date = source.log_date)
-            WHEN MATCHED THEN
-                UPDATE SET
-                    medications_taken = ?,
-                    medications_missed_count = ?,
-                    side_effects_reported = ?,
-                    side_effects_description = ?,
-                    session_id = ?
-            WHEN NOT MATCHED THEN
-                INSERT (senior_id, log_date, medications_taken, medications_missed_count,
-                        side_effects_reported, side_effects_description, session_id)
-                VALUES (?, ?, ?, ?, ?, ?, ?);
-        """,
-            senior_id, call_date.date(),
+            red_flags,
+            cognitive.get('overall_score') if cognitive else None,
+            cognitive.get('notes') if cognitive else None,
+            bool(medication),
             medication.get('medications_taken'),
             medication.get('medications_missed_count', 0),
             medication.get('side_effects_reported', False),
             medication.get('side_effects_description'),
-            session_id,
-            senior_id, call_date.date(),
-            medication.get('medications_taken'),
-            medication.get('medications_missed_count', 0),
-            medication.get('side_effects_reported', False),
-            medication.get('side_effects_description'),
-            session_id
-        )
-
-    def _save_health_alerts(self, cursor, senior_id: str, session_id: str, call_date: datetime, alerts: List[Dict]):
-        """Save health alerts to database"""
-        for alert in alerts:
-            cursor.execute("""
-                INSERT INTO health_alerts
-                (senior_id, alert_date, alert_type, severity, description,
-                 related_session_id, related_metric_value)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """,
-                senior_id, call_date, alert['alert_type'], alert['severity'],
-                alert['description'], session_id, alert.get('related_metric_value')
-            )
+            vital_rows,
+            alert_rows
+        ]
@@ -3,43 +3,462 @@ Analytics Sync Service
 Automatically syncs conversation data from Cosmos DB to PostgreSQL analytics database
 Call this after every conversation ends and summary is generated
 """
+import csv
+import io
 import os
 import re
-import psycopg2
+import threading
+from functools import lru_cache
+from multiprocessing import Pool
+from psycopg2 import InterfaceError, OperationalError
 from psycopg2.extras import execute_values
-from datetime import datetime
+from psycopg2.pool import ThreadedConnectionPool
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# ============================================
+# PRECOMPILED PATTERNS (used by the extraction methods)
+# ============================================
+
+# Vitals (searched per message)
+_BP_PATTERNS = [
+    re.compile(r'(\d{2,3})\s*/\s*(\d{2,3})', re.IGNORECASE),  # 120/80
+    re.compile(r'(\d{2,3})\s+over\s+(\d{2,3})', re.IGNORECASE),  # 120 over 80
+]
+_HR_CONTEXT_RE = re.compile(r'\b(heart rate|pulse|bpm)\b', re.IGNORECASE)
+_HR_VALUE_RE = re.compile(r'\b(\d{2,3})\b')
+_SLEEP_PATTERNS = [
+    re.compile(r'(\d+\.?\d*)\s*hours?\s+(?:of\s+)?sleep', re.IGNORECASE),
+    re.compile(r'slept?\s+(?:for\s+)?(\d+\.?\d*)\s*hours?', re.IGNORECASE),
+    re.compile(r'got\s+(?:about\s+)?(\d+\.?\d*)\s*hours?', re.IGNORECASE),
+]
+_PAIN_CONTEXT_RE = re.compile(r'\b(pain|hurt|ache|discomfort)\b', re.IGNORECASE)
+_PAIN_VALUE_RE = re.compile(r'\b(\d{1,2})\s*(?:out of 10|/10)?\b')
+_MEDS_TAKEN_RE = re.compile(r'\b(took|taken|take|taking)\s+(my\s+)?(meds|medications?|pills?)\b', re.IGNORECASE)
+_MEDS_AFFIRMED_RE = re.compile(r'\b(yes|yeah|yep|uh-huh),?\s+(I\s+)?(did|took|taken)\b', re.IGNORECASE)
+_MEDS_MISSED_RE = re.compile(r'\b(didn\'?t|haven\'?t|forgot|missed)\s+(my\s+)?(meds|medications?|pills?)\b', re.IGNORECASE)
+
+# All of the above in one scan per message: same patterns as named groups,
+# written in lowercase and run case-sensitively on the lowercased message
+# (cheaper than IGNORECASE). The zero-width lookahead reports every position,
+# so each kind's first hit is exactly what a separate .search() would find.
+# Every numeric vital needs a digit, so messages without one (most of them)
+# only get the medication check. Heart rate and pain values are still read
+# with _HR_VALUE_RE / _PAIN_VALUE_RE once their context is seen
+_DIGIT_RE = re.compile(r'\d')
+# Each medication pattern needs one of these (lowercased) words to match
+_MEDS_KEYWORDS = ('med', 'pill', 'did', 'took', 'taken')
+_MSG_VITALS_SCAN_RE = re.compile(
+    r'(?=(?P<bp>(?P<bp_sys>\d{2,3})\s*/\s*(?P<bp_dia>\d{2,3}))'
+    r'|(?P<bp_over>(?P<bp_over_sys>\d{2,3})\s+over\s+(?P<bp_over_dia>\d{2,3}))'
+    r'|(?P<sleep>(?P<sleep_hours>\d+\.?\d*)\s*hours?\s+(?:of\s+)?sleep)'
+    r'|(?P<slept>slept?\s+(?:for\s+)?(?P<slept_hours>\d+\.?\d*)\s*hours?)'
+    r'|(?P<got>got\s+(?:about\s+)?(?P<got_hours>\d+\.?\d*)\s*hours?)'
+    r'|(?P<hr_context>\b(?:heart rate|pulse|bpm)\b)'
+    r'|(?P<pain_context>\b(?:pain|hurt|ache|discomfort)\b)'
+    r'|(?P<meds_taken>\b(?:took|taken|take|taking)\s+(?:my\s+)?(?:meds|medications?|pills?)\b)'
+    r'|(?P<meds_affirmed>\b(?:yes|yeah|yep|uh-huh),?\s+(?:i\s+)?(?:did|took|taken)\b)'
+    r'|(?P<meds_missed>\b(?:didn\'?t|haven\'?t|forgot|missed)\s+(?:my\s+)?(?:meds|medications?|pills?)\b))'
+)
+
+# Reminders (searched over the whole conversation). Patterns flagged True are
+# "<keyword part> ... <date phrase>": only the keyword part is stored and
+# _iter_reminder_matches finds the date phrase the way a trailing
+# '.*?' + _DATE_TAIL_RE would, without the quadratic rescans of '.*?'
+_DATE_TAIL_RE = re.compile(r'\b(next|this|on)\s+(\w+day|\w+\s+\d+)', re.IGNORECASE)
+_APPOINTMENT_PATTERNS = [
+    (re.compile(r'\b(doctor|dentist|medical|appointment|checkup|visit)\b', re.IGNORECASE), True),
+    (re.compile(r'\b(I have|got)\s+(?:a|an)?\s*(appointment|doctor|dentist|checkup)\b', re.IGNORECASE), True),
+    (re.compile(r'\b(appointment|doctor|dentist)\s+(on|this|next)\s+(\w+day|\w+\s+\d+)', re.IGNORECASE), False),
+]
+_EVENT_PATTERNS = [
+    (re.compile(r'\b(birthday|anniversary|party|gathering|celebration)\b', re.IGNORECASE), True),
+    (re.compile(r'\b(visiting|visit from|seeing)\s+(?:my\s+)?(family|kids|grandkids|children)\b', re.IGNORECASE), True),
+]
+# Date phrases the patterns capture that are parsed without dateparser
+_RELATIVE_DAYS = {'today': 0, 'yesterday': -1}
+_WEEKDAYS = {
+    'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
+    'friday': 4, 'saturday': 5, 'sunday': 6,
+}
+_MONTHS = {
+    'jan': 1, 'january': 1, 'feb': 2, 'february': 2, 'mar': 3, 'march': 3,
+    'apr': 4, 'april': 4, 'may': 5, 'jun': 6, 'june': 6, 'jul': 7, 'july': 7,
+    'aug': 8, 'august': 8, 'sep': 9, 'sept': 9, 'september': 9,
+    'oct': 10, 'october': 10, 'nov': 11, 'november': 11, 'dec': 12, 'december': 12,
+}
+
+# Activity (scanned once over lowercased user text). Each named group is one
+# cue; the zero-width lookahead lets cues nested in longer phrases still match
+_ACTIVITY_SCAN_RE = re.compile(
+    r'(?=(?P<walk>\b(?:walked|walk|walking)\b)'
+    r'|(?P<block>around\s+the\s+block)'
+    r'|(?P<mailbox>to\s+the\s+mailbox)'
+    r'|(?P<yoga>yoga)|(?P<stretching>stretching)|(?P<swimming>swimming)'
+    r'|(?P<gardening>gardening)|(?P<exercise>exercise)|(?P<workout>workout)'
+    r'|(?P<left_house>\b(?:went out|left house|outside|went to|drove to)\b)'
+    r'|(?P<social_verb>\b(?:talked to|spoke with|visited|visit from|saw|called|video call)\b)'
+    r'|(?P<sedentary>\b(?:sat|sitting|lying down|resting|nap|bed all day)\b))'
+)
+_WALK_DURATION_RE = re.compile(r'walked?\s+(?:for\s+)?(\d+)\s*minutes?')
+_EXERCISE_TYPES = ['yoga', 'stretching', 'swimming', 'gardening', 'exercise', 'workout']
+_SOCIAL_RE = re.compile(r'\b(talked to|spoke with|visited|visit from|saw|called|video call)\b.*\b(family|friend|kids|grandkids|children|neighbor)')
+
+# Falls (scanned once over lowercased conversation text); each cue maps to the
+# facts it supports ('trigger' = counts as a fall-related mention at all)
+_FALLS_SCAN_RE = re.compile(
+    r'(?=(?P<fell>\b(?:fell|fall|fallen)\b)'
+    r'|(?P<near_fall>\b(?:almost fell|nearly fell|caught myself)\b)'
+    r'|(?P<lost_balance>\blost balance\b)'
+    r'|(?P<lost_my_balance>\blost\s+(?:my\s+)?balance\b)'
+    r'|(?P<dizzy>\bdizzy\b)|(?P<dizziness>\bdizziness\b)|(?P<lightheaded>\blightheaded\b)'
+    r'|(?P<tripped>\btripped\b)|(?P<trip>\btrip\b)'
+    r'|(?P<slipped>\bslipped\b)|(?P<slip>\bslip\b)'
+    r'|(?P<stumbled>\bstumbled\b)'
+    r'|(?P<bathroom>\b(?:bathroom|shower|bath|toilet)\b)'
+    r'|(?P<bedroom>\bbedroom\b)'
+    r'|(?P<kitchen>\bkitchen\b)'
+    r'|(?P<stairs>\b(?:stairs|steps)\b)'
+    r'|(?P<outside>\b(?:outside|yard|sidewalk|street)\b)'
+    r'|(?P<injury>\b(?:hurt|injured|bruise|cut|pain|sore)\b)'
+    r'|(?P<weakness>\b(?:weak|weakness|legs gave out)\b))'
+)
+_FALLS_CUE_FACTS = {
+    'fell': {'trigger', 'fall'},
+    'near_fall': {'near_fall'},
+    'lost_balance': {'trigger', 'loss_of_balance'},
+    'lost_my_balance': {'loss_of_balance'},
+    'dizzy': {'trigger', 'dizzy_spell', 'felt_dizzy'},
+    'dizziness': {'dizzy_spell', 'felt_dizzy'},
+    'lightheaded': {'dizzy_spell'},
+    'tripped': {'trigger', 'tripped'},
+    'trip': {'tripped'},
+    'slipped': {'trigger', 'slipped'},
+    'slip': {'slipped'},
+    'stumbled': {'trigger'},
+    'bathroom': {'bathroom'},
+    'bedroom': {'bedroom'},
+    'kitchen': {'kitchen'},
+    'stairs': {'stairs'},
+    'outside': {'outside'},
+    'injury': {'injured'},
+    'weakness': {'weakness'},
+}
+# Incident types and locations in priority order
+_FALL_INCIDENT_TYPES = ['fall', 'near_fall', 'loss_of_balance', 'dizzy_spell']
+_FALL_LOCATIONS = ['bathroom', 'bedroom', 'kitchen', 'stairs', 'outside']
+
+# Extractor gating (scanned once over lowercased conversation text): an
+# extractor only runs when its group matched. Each group covers every cue the
+# extractor needs to return anything, so skipping never drops a result
+_TRIGGER_SCAN_RE = re.compile(
+    r'(?P<falls>\b(?:fell|fall|fallen|lost balance|dizzy|tripped|slipped|stumbled)\b)'
+    r'|(?P<reminders>\b(?:doctor|dentist|medical|appointment|checkup|visit|visiting|seeing'
+    r'|birthday|anniversary|party|gathering|celebration)\b)'
+)
+_TRIGGER_GROUPS = frozenset(_TRIGGER_SCAN_RE.groupindex)
+
+# Condition tracking (status/symptom patterns are per condition, see _condition_patterns)
+_DEFAULT_CONDITIONS = ['diabetes', 'hypertension', 'arthritis', 'copd', 'heart disease', 'asthma']
+_LIMITED_ACTIVITIES_RE = re.compile(r'\b(can\'?t|couldn\'?t|unable to|too hard to)\b')
+
+# Cognitive indicators (searched per user message)
+_MEMORY_REF_RE = re.compile(r'\b(remember|last time|before|earlier)\b', re.IGNORECASE)
+_PLANNING_RE = re.compile(r'\b(will|going to|plan|later|tomorrow)\b', re.IGNORECASE)
+
+
+# INSERT statement (execute_values form) and upsert conflict-key positions, per table
+_TABLE_INSERTS = {
+    'vitals': ("""
+        INSERT INTO senior_vitals (senior_id, recorded_at, vital_type, vital_value, unit, source, session_id)
+        VALUES %s
+    """, None),
+    'cognitive': ("""
+        INSERT INTO cognitive_assessments
+        (senior_id, assessment_date, memory_score, orientation_score, language_score,
+         executive_function_score, overall_score, session_id)
+        VALUES %s
+    """, None),
+    'call_summary': ("""
+        INSERT INTO call_summary
+        (senior_id, call_date, session_id, call_duration, call_completed,
+         medication_adherence, summary_text)
+        VALUES %s
+        ON CONFLICT (session_id) DO NOTHING
+        RETURNING session_id
+    """, None),
+    'medication': ("""
+        INSERT INTO medication_adherence
+        (senior_id, log_date, medications_taken, session_id)
+        VALUES %s
+        ON CONFLICT (senior_id, log_date) DO UPDATE
+        SET medications_taken = EXCLUDED.medications_taken
+    """, (0, 1)),
+    'reminders': ("""
+        INSERT INTO senior_reminders
+        (senior_id, reminder_type, title, description, reminder_date,
+         priority, category, created_by)
+        VALUES %s
+    """, None),
+    'activity': ("""
+        INSERT INTO senior_activity
+        (senior_id, activity_date, walked, walk_duration_minutes, walk_distance,
+         exercise_type, activity_level, left_house, social_interaction, session_id)
+        VALUES %s
+        ON CONFLICT (senior_id, activity_date) DO UPDATE
+        SET walked = EXCLUDED.walked,
+            walk_duration_minutes = EXCLUDED.walk_duration_minutes,
+            walk_distance = EXCLUDED.walk_distance,
+            exercise_type = EXCLUDED.exercise_type,
+            activity_level = EXCLUDED.activity_level,
+            left_house = EXCLUDED.left_house,
+            social_interaction = EXCLUDED.social_interaction
+    """, (0, 1)),
+    'falls': ("""
+        INSERT INTO senior_falls
+        (senior_id, incident_date, incident_type, location, injured,
+         felt_dizzy, tripped, slipped, weakness, severity, session_id)
+        VALUES %s
+    """, None),
+    'conditions': ("""
+        INSERT INTO condition_tracking
+        (senior_id, tracking_date, condition_name, status, symptoms_present,
+         limited_activities, impact_on_daily_life, session_id)
+        VALUES %s
+        ON CONFLICT (senior_id, tracking_date, condition_name) DO UPDATE
+        SET status = EXCLUDED.status,
+            symptoms_present = EXCLUDED.symptoms_present,
+            limited_activities = EXCLUDED.limited_activities,
+            impact_on_daily_life = EXCLUDED.impact_on_daily_life
+    """, (0, 1, 2)),
+}
+
+
+def _trigger_set(text_lower: str) -> set:
+    """
+    Find which gated extractors have a cue in the conversation (one pass)
+
+    Args:
+        text_lower: Lowercased conversation text
+
+    Returns:
+        Set of _TRIGGER_SCAN_RE group names that matched
+    """
+    triggers = set()
+    for match in _TRIGGER_SCAN_RE.finditer(text_lower):
+        triggers.add(match.lastgroup)
+        if len(triggers) == len(_TRIGGER_GROUPS):
+            break
+    return triggers
+
+
+@lru_cache(maxsize=256)
+def _condition_patterns(condition_lower: str) -> Dict[str, "re.Pattern"]:
+    """
+    Compile the status and symptom patterns for one condition (once per condition)
+
+    Args:
+        condition_lower: Lowercased condition name
+
+    Returns:
+        Dict of compiled patterns: worsening, improving, flare_up, symptoms
+    """
+    return {
+        'worsening': re.compile(rf'{condition_lower}.*\b(worse|worsening|flare|flaring up|acting up)\b'),
+        'improving': re.compile(rf'{condition_lower}.*\b(better|improving|under control)\b'),
+        'flare_up': re.compile(rf'{condition_lower}.*\b(flare-?up|bad day|really bad)\b'),
+        'symptoms': re.compile(rf'{condition_lower}.*\b(hurting|pain|swelling|trouble|difficult)\b'),
+    }
+
+
+@lru_cache(maxsize=8192)
+def _parse_iso_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp ('Z' suffix allowed), memoized since messages
+    in a session often share the same second
+
+    Args:
+        timestamp: ISO-8601 timestamp string
+
+    Returns:
+        Parsed datetime
+    """
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+def _iter_reminder_matches(pattern: "re.Pattern", has_date_tail: bool, text: str):
+    """
+    Find reminder mentions for one _APPOINTMENT_PATTERNS / _EVENT_PATTERNS entry
+
+    With has_date_tail, matches are exactly those of pattern + '.*?' + _DATE_TAIL_RE
+    under finditer: each keyword match is paired with the first date phrase after
+    it on the same line. The last date phrase found is reused while it still lies
+    ahead, so a long call full of keywords but short on dates stays linear instead
+    of rescanning to the end of the text for every keyword.
+
+    Without it, the pattern itself captures (keyword, qualifier, date phrase).
+
+    Yields:
+        (matched text, first group, qualifier, date phrase) per mention,
+        where the qualifier is the "next" / "this" / "on" before the date
+    """
+    if not has_date_tail:
+        for match in pattern.finditer(text):
+            yield match.group(0), match.group(1), match.group(2), match.group(3)
+        return
+
+    tail = None          # Leftmost date phrase at or after tail_from (None = there is none)
+    tail_from = None
+    tail_line_start = 0  # Position right after the last newline before tail
+    pos = 0
+    while True:
+        head = pattern.search(text, pos)
+        if not head:
+            return
+
+        if tail_from is None or tail_from > head.end() or (tail and tail.start() < head.end()):
+            tail_from = head.end()
+            tail = _DATE_TAIL_RE.search(text, tail_from)
+            if tail:
+                tail_line_start = text.rfind('\n', 0, tail.start()) + 1
+
+        # '.' doesn't match newlines, so the date phrase must be on the keyword's line
+        if tail and tail_line_start <= head.end():
+            yield text[head.start():tail.end()], head.group(1), tail.group(1), tail.group(2)
+            pos = tail.end()
+        else:
+            pos = head.start() + 1
+
+
+def _parse_simple_date(date_str: str, base_day: date, next_week: bool = False) -> Optional[date]:
+    """
+    Parse the date shapes the reminder patterns capture: "today"/"yesterday",
+    a weekday name (the next such day, today included) or "<month> <day>" (this year)
+
+    Args:
+        date_str: Date phrase captured from the conversation ("Tuesday", "Nov 14")
+        base_day: Day the phrase is relative to
+        next_week: Phrase followed "next", so a weekday naming today means a week out
+
+    Returns:
+        Parsed date, or None for anything else (left to dateparser)
+    """
+    tokens = date_str.lower().split()
+
+    if len(tokens) == 1 and tokens[0] in _RELATIVE_DAYS:
+        return base_day + timedelta(days=_RELATIVE_DAYS[tokens[0]])
+
+    if len(tokens) == 1 and tokens[0] in _WEEKDAYS:
+        days_ahead = (_WEEKDAYS[tokens[0]] - base_day.weekday()) % 7
+        if next_week and not days_ahead:
+            days_ahead = 7
+        return base_day + timedelta(days=days_ahead)
+
+    if len(tokens) == 2 and tokens[0] in _MONTHS and tokens[1].isdigit():
+        try:
+            return date(base_day.year, _MONTHS[tokens[0]], int(tokens[1]))
+        except ValueError:  # "February 30"
+            return None
+
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_date_cached(date_str: str, base_day: date, next_week: bool = False) -> Optional[date]:
+    """
+    Parse a reminder date phrase relative to base_day, memoized per (phrase, day)
+
+    Args:
+        date_str: Date phrase captured from the conversation ("Tuesday", "March 5")
+        base_day: Day the phrase is relative to
+        next_week: Phrase followed "next" ("next Tuesday" said on a Tuesday is a week out)
+
+    Returns:
+        Parsed date or None
+    """
+    parsed = _parse_simple_date(date_str, base_day, next_week)
+    if parsed or date_str.lower().endswith('day'):
+        # Every dated "-day" word is handled above ("birthday", "someday" aren't dates)
+        return parsed
+
+    # Anything else ("the 15") goes through the full parser
+    import dateparser
+
+    parsed = dateparser.parse(date_str, settings={'RELATIVE_BASE': datetime.combine(base_day, datetime.min.time())})
+    return parsed.date() if parsed else None
+
+
+# Connection pool shared by every AnalyticsSyncService in the process (created
+# on first use, so a failed connect is retried by the next instance)
+_pool: Optional[ThreadedConnectionPool] = None
+_pool_pid: Optional[int] = None  # Process that opened _pool (forked children must not reuse its sockets)
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_connections: int) -> Optional[ThreadedConnectionPool]:
+    """
+    Get the shared PostgreSQL connection pool, creating it on first use
+
+    Args:
+        max_connections: Upper bound on open connections (used when creating the pool)
+
+    Returns:
+        Connection pool, or None if PostgreSQL is unreachable
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid != os.getpid():
+            # Inherited across fork: drop the parent's pool without closing its connections
+            _pool = None
+        if _pool is None:
+            try:
+                # Get password from environment (set by Key Vault or .env)
+                pg_password = os.getenv('AZURE_POSTGRES_PASSWORD', '').strip("'")
+
+                _pool = ThreadedConnectionPool(
+                    minconn=1,
+                    maxconn=max_connections,
+                    host=os.getenv('AZURE_POSTGRES_SERVER', '').strip("'"),
+                    database=os.getenv('AZURE_POSTGRES_DATABASE', '').strip("'"),
+                    user=os.getenv('AZURE_POSTGRES_USERNAME', '').strip("'"),
+                    password=pg_password,
+                    port=os.getenv('AZURE_POSTGRES_PORT', '5432').strip("'"),
+                    sslmode='require',
+                    # Pooled connections sit idle between calls; TCP keepalives stop
+                    # the server or a load balancer from silently dropping them
+                    keepalives=1,
+                    keepalives_idle=60,
+                    keepalives_interval=10,
+                    keepalives_count=3
+                )
+                _pool_pid = os.getpid()
+                logger.info("✅ Connected to PostgreSQL analytics database")
+            except Exception as e:
+                logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
+        return _pool
+
+
 class AnalyticsSyncService:
     """Syncs health data from conversations to PostgreSQL for analytics"""
 
+    # Row count from which COPY FROM STDIN is used instead of execute_values
+    COPY_MIN_ROWS = 10
+    # Connections kept by the process-wide pool (concurrent syncs beyond this fail fast)
+    POOL_MAX_CONNECTIONS = 10
+    # Attempts per batch; a connection that died while idle in the pool is
+    # replaced by a fresh one for the retry
+    SYNC_ATTEMPTS = 2
+
     def __init__(self):
-        """Initialize PostgreSQL connection"""
-        try:
-            # Get password from environment (set by Key Vault or .env)
-            pg_password = os.getenv('AZURE_POSTGRES_PASSWORD', '').strip("'")
-
-            self.pg_conn = psycopg2.connect(
-                host=os.getenv('AZURE_POSTGRES_SERVER', '').strip("'"),
-                database=os.getenv('AZURE_POSTGRES_DATABASE', '').strip("'"),
-                user=os.getenv('AZURE_POSTGRES_USERNAME', '').strip("'"),
-                password=pg_password,
-                port=os.getenv('AZURE_POSTGRES_PORT', '5432').strip("'"),
-                sslmode='require'
-            )
-            self.pg_conn.autocommit = False
-            logger.info("✅ Connected to PostgreSQL analytics database")
-        except Exception as e:
-            logger.error(f"❌ Failed to connect to PostgreSQL: {e}")
-            self.pg_conn = None
+        """Attach to the shared PostgreSQL connection pool"""
+        self._pool = _get_pool(self.POOL_MAX_CONNECTIONS)
 
-    def __del__(self):
-        """Close connection on cleanup"""
-        if self.pg_conn:
-            self.pg_conn.close()
+    def close(self):
+        """Detach from the connection pool (connections stay open for other syncs)"""
+        self._pool = None
 
     # ============================================
     # DATA EXTRACTION METHODS
@@ -47,12 +466,8 @@ class AnalyticsSyncService:
 
     def extract_blood_pressure(self, text: str) -> Optional[Tuple[int, int]]:
         """Extract blood pressure like '120/80' or '120 over 80'"""
-        patterns = [
-            r'(\d{2,3})\s*/\s*(\d{2,3})',  # 120/80
-            r'(\d{2,3})\s+over\s+(\d{2,3})',  # 120 over 80
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _BP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 systolic, diastolic = int(match.group(1)), int(match.group(2))
                 if 60 <= systolic <= 250 and 40 <= diastolic <= 150:
@@ -61,8 +476,8 @@ class AnalyticsSyncService:
 
     def extract_heart_rate(self, text: str) -> Optional[int]:
         """Extract heart rate mentions"""
-        if re.search(r'\b(heart rate|pulse|bpm)\b', text, re.IGNORECASE):
-            match = re.search(r'\b(\d{2,3})\b', text)
+        if _HR_CONTEXT_RE.search(text):
+            match = _HR_VALUE_RE.search(text)
             if match:
                 hr = int(match.group(1))
                 if 30 <= hr <= 200:
@@ -71,13 +486,8 @@ class AnalyticsSyncService:
 
     def extract_sleep_hours(self, text: str) -> Optional[float]:
         """Extract sleep duration"""
-        patterns = [
-            r'(\d+\.?\d*)\s*hours?\s+(?:of\s+)?sleep',
-            r'slept?\s+(?:for\s+)?(\d+\.?\d*)\s*hours?',
-            r'got\s+(?:about\s+)?(\d+\.?\d*)\s*hours?',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _SLEEP_PATTERNS:
+            match = pattern.search(text)
             if match:
                 hours = float(match.group(1))
                 if 0 <= hours <= 24:
@@ -86,8 +496,8 @@ class AnalyticsSyncService:
 
     def extract_pain_level(self, text: str) -> Optional[int]:
         """Extract pain level (1-10 scale)"""
-        if re.search(r'\b(pain|hurt|ache|discomfort)\b', text, re.IGNORECASE):
-            match = re.search(r'\b(\d{1,2})\s*(?:out of 10|/10)?\b', text)
+        if _PAIN_CONTEXT_RE.search(text):
+            match = _PAIN_VALUE_RE.search(text)
             if match:
                 pain = int(match.group(1))
                 if 0 <= pain <= 10:
@@ -96,58 +506,106 @@ class AnalyticsSyncService:
 
     def extract_medications_taken(self, text: str) -> Optional[bool]:
         """Determine if medications were taken"""
-        if re.search(r'\b(took|taken|take|taking)\s+(my\s+)?(meds|medications?|pills?)\b', text, re.IGNORECASE):
+        if _MEDS_TAKEN_RE.search(text):
             return True
-        if re.search(r'\b(yes|yeah|yep|uh-huh),?\s+(I\s+)?(did|took|taken)\b', text, re.IGNORECASE):
+        if _MEDS_AFFIRMED_RE.search(text):
             return True
-        if re.search(r'\b(didn\'?t|haven\'?t|forgot|missed)\s+(my\s+)?(meds|medications?|pills?)\b', text, re.IGNORECASE):
+        if _MEDS_MISSED_RE.search(text):
             return False
         return None
 
-    def extract_reminders(self, messages: List[Dict]) -> List[Dict]:
+    def _extract_vitals_from_message(self, text: str) -> Tuple[List[Tuple], Optional[bool]]:
         """
-        Extract reminders, appointments, and upcoming events from conversation
-        Returns list of reminder dicts with: type, title, description, date, priority
+        Extract every vital and the medication answer from one message in a single scan
+        (same results as the extract_blood_pressure ... extract_medications_taken calls)
+
+        Returns:
+            ([(vital_type, value, unit), ...], medications_taken or None)
         """
-        from datetime import datetime, timedelta
-        import dateparser
+        text_lower = text.lower()
 
-        reminders = []
+        if not _DIGIT_RE.search(text):
+            if not any(keyword in text_lower for keyword in _MEDS_KEYWORDS):
+                return [], None
+            return [], self.extract_medications_taken(text)
 
-        # Combine all messages into conversation text
-        conversation_text = " ".join([msg.get('content', '') for msg in messages])
+        first = {}
+        for match in _MSG_VITALS_SCAN_RE.finditer(text_lower):
+            first.setdefault(match.lastgroup, match)
 
-        # Patterns for appointments and events
-        appointment_patterns = [
-            r'\b(doctor|dentist|medical|appointment|checkup|visit)\b.*?\b(next|this|on)\s+(\w+day|\w+\s+\d+)',
-            r'\b(I have|got)\s+(?:a|an)?\s*(appointment|doctor|dentist|checkup)\b.*?\b(next|this|on)\s+(\w+day|\w+\s+\d+)',
-            r'\b(appointment|doctor|dentist)\s+(?:on|this|next)\s+(\w+day|\w+\s+\d+)',
-        ]
+        vitals = []
 
-        event_patterns = [
-            r'\b(birthday|anniversary|party|gathering|celebration)\b.*?\b(next|this|on)\s+(\w+day|\w+\s+\d+)',
-            r'\b(visiting|visit from|seeing)\s+(?:my\s+)?(family|kids|grandkids|children)\b.*?\b(next|this|on)\s+(\w+day|\w+\s+\d+)',
-        ]
+        # Blood pressure ('120/80' form first, then '120 over 80')
+        for kind in ('bp', 'bp_over'):
+            match = first.get(kind)
+            if match:
+                systolic, diastolic = int(match.group(f'{kind}_sys')), int(match.group(f'{kind}_dia'))
+                if 60 <= systolic <= 250 and 40 <= diastolic <= 150:
+                    vitals.append(('bp_systolic', systolic, 'mmHg'))
+                    vitals.append(('bp_diastolic', diastolic, 'mmHg'))
+                    break
+
+        # Heart rate
+        if 'hr_context' in first:
+            match = _HR_VALUE_RE.search(text)
+            if match and 30 <= int(match.group(1)) <= 200:
+                vitals.append(('heart_rate', int(match.group(1)), 'bpm'))
+
+        # Sleep hours (first pattern with an in-range value wins; 0 isn't recorded)
+        for kind in ('sleep', 'slept', 'got'):
+            match = first.get(kind)
+            if match:
+                hours = float(match.group(f'{kind}_hours'))
+                if 0 <= hours <= 24:
+                    if hours:
+                        vitals.append(('sleep_hours', hours, 'hours'))
+                    break
+
+        # Pain level (0 isn't recorded)
+        if 'pain_context' in first:
+            match = _PAIN_VALUE_RE.search(text)
+            if match and 0 < int(match.group(1)) <= 10:
+                vitals.append(('pain_level', int(match.group(1)), 'scale'))
+
+        # Medications
+        if 'meds_taken' in first or 'meds_affirmed' in first:
+            medications_taken = True
+        elif 'meds_missed' in first:
+            medications_taken = False
+        else:
+            medications_taken = None
 
-        task_patterns = [
-            r'\bneed to\s+(.*?)\s+(?:by|before|on)\s+(\w+day|\w+\s+\d+)',
-            r'\bremember to\s+(.*?)\s+(?:by|before|on)\s+(\w+day|\w+\s+\d+)',
-        ]
+        return vitals, medications_taken
+
+    def extract_reminders(self, conversation_text: str) -> List[Dict]:
+        """
+        Extract reminders, appointments, and upcoming events from conversation
+        Returns list of reminder dicts with: type, title, description, date, priority
+
+        Args:
+            conversation_text: All message contents joined with spaces
+        """
+        reminders = []
+
+        # Every pattern needs a "next/this/on <date>" phrase, so one scan rules out most calls
+        if not _DATE_TAIL_RE.search(conversation_text):
+            return reminders
+
+        now = datetime.now()
+        today = now.date()
 
         # Extract appointments
-        for pattern in appointment_patterns:
-            matches = re.finditer(pattern, conversation_text, re.IGNORECASE)
-            for match in matches:
+        for pattern, has_date_tail in _APPOINTMENT_PATTERNS:
+            for mention, _, qualifier, date_str in _iter_reminder_matches(pattern, has_date_tail, conversation_text):
                 try:
-                    date_str = match.group(match.lastindex)
-                    parsed_date = dateparser.parse(date_str, settings={'RELATIVE_BASE': datetime.now()})
+                    parsed_date = _parse_date_cached(date_str, today, qualifier.lower() == 'next')
 
-                    if parsed_date and parsed_date.date() >= datetime.now().date():
+                    if parsed_date and parsed_date >= today:
                         reminders.append({
                             'type': 'appointment',
                             'title': 'Medical appointment',
-                            'description': match.group(0)[:200],
-                            'date': parsed_date.date(),
+                            'description': mention[:200],
+                            'date': parsed_date,
                             'priority': 'high',
                             'category': 'doctor'
                         })
@@ -155,20 +613,18 @@ class AnalyticsSyncService:
                     pass
 
         # Extract events
-        for pattern in event_patterns:
-            matches = re.finditer(pattern, conversation_text, re.IGNORECASE)
-            for match in matches:
+        for pattern, has_date_tail in _EVENT_PATTERNS:
+            for mention, keyword, qualifier, date_str in _iter_reminder_matches(pattern, has_date_tail, conversation_text):
                 try:
-                    date_str = match.group(match.lastindex)
-                    parsed_date = dateparser.parse(date_str, settings={'RELATIVE_BASE': datetime.now()})
+                    parsed_date = _parse_date_cached(date_str, today, qualifier.lower() == 'next')
 
-                    if parsed_date and parsed_date.date() >= datetime.now().date():
-                        event_type = match.group(1).lower()
+                    if parsed_date and parsed_date >= today:
+                        event_type = keyword.lower()
                         reminders.append({
                             'type': 'event',
                             'title': f'{event_type.capitalize()} event',
-                            'description': match.group(0)[:200],
-                            'date': parsed_date.date(),
+                            'description': mention[:200],
+                            'date': parsed_date,
                             'priority': 'normal',
                             'category': 'family' if 'family' in event_type or 'visit' in event_type else 'social'
                         })
@@ -177,43 +633,45 @@ class AnalyticsSyncService:
 
         return reminders
 
-    def extract_activity_data(self, messages: List[Dict]) -> Optional[Dict]:
+    def extract_activity_data(self, user_text_lower: str) -> Optional[Dict]:
         """
         Extract physical activity data from conversation
         Returns dict with: walked, walk_duration, exercise_type, activity_level, left_house, social_interaction
+
+        Args:
+            user_text_lower: Lowercased user message contents joined with spaces
         """
-        conversation_text = " ".join([msg.get('content', '') for msg in messages if msg['role'] == 'user']).lower()
 
         activity_data = {}
+        cues = {match.lastgroup for match in _ACTIVITY_SCAN_RE.finditer(user_text_lower)}
 
         # Walking
-        if re.search(r'\b(walked|walk|walking)\b', conversation_text):
+        if 'walk' in cues:
             activity_data['walked'] = True
 
             # Duration
-            duration_match = re.search(r'walked?\s+(?:for\s+)?(\d+)\s*minutes?', conversation_text)
+            duration_match = _WALK_DURATION_RE.search(user_text_lower)
             if duration_match:
                 activity_data['walk_duration_minutes'] = int(duration_match.group(1))
 
             # Distance
-            if re.search(r'around\s+the\s+block', conversation_text):
+            if 'block' in cues:
                 activity_data['walk_distance'] = 'around the block'
-            elif re.search(r'to\s+the\s+mailbox', conversation_text):
+            elif 'mailbox' in cues:
                 activity_data['walk_distance'] = 'to the mailbox'
 
         # Exercise
-        exercise_types = ['yoga', 'stretching', 'swimming', 'gardening', 'exercise', 'workout']
-        for ex_type in exercise_types:
-            if ex_type in conversation_text:
+        for ex_type in _EXERCISE_TYPES:
+            if ex_type in cues:
                 activity_data['exercise_type'] = ex_type
                 break
 
         # Leaving house
-        if re.search(r'\b(went out|left house|outside|went to|drove to)\b', conversation_text):
+        if 'left_house' in cues:
             activity_data['left_house'] = True
 
-        # Social interaction
-        if re.search(r'\b(talked to|spoke with|visited|visit from|saw|called|video call)\b.*\b(family|friend|kids|grandkids|children|neighbor)', conversation_text):
+        # Social interaction (only worth the full search when a social verb was seen)
+        if 'social_verb' in cues and _SOCIAL_RE.search(user_text_lower):
             activity_data['social_interaction'] = True
 
         # Activity level assessment
@@ -223,103 +681,94 @@ class AnalyticsSyncService:
             activity_data['activity_level'] = 'light'
         else:
             # Check for sedentary indicators
-            if re.search(r'\b(sat|sitting|lying down|resting|nap|bed all day)\b', conversation_text):
+            if 'sedentary' in cues:
                 activity_data['activity_level'] = 'sedentary'
 
         return activity_data if activity_data else None
 
-    def extract_falls_data(self, messages: List[Dict]) -> Optional[Dict]:
+    def extract_falls_data(self, text_lower: str) -> Optional[Dict]:
         """
         Extract fall incidents from conversation
         Returns dict with: incident_type, location, injured, felt_dizzy, etc.
+
+        Args:
+            text_lower: Lowercased message contents joined with spaces
         """
-        conversation_text = " ".join([msg.get('content', '') for msg in messages]).lower()
+        # One scan collects every fall-related fact mentioned
+        facts = set()
+        for match in _FALLS_SCAN_RE.finditer(text_lower):
+            facts |= _FALLS_CUE_FACTS[match.lastgroup]
 
         # Check for fall mentions
-        if not re.search(r'\b(fell|fall|fallen|tripped|slipped|lost balance|dizzy|stumbled)\b', conversation_text):
+        if 'trigger' not in facts:
             return None
 
         falls_data = {}
 
         # Incident type
-        if re.search(r'\b(fell|fall|fallen)\b', conversation_text):
-            falls_data['incident_type'] = 'fall'
-        elif re.search(r'\b(almost fell|nearly fell|caught myself)\b', conversation_text):
-            falls_data['incident_type'] = 'near_fall'
-        elif re.search(r'\b(lost\s+(?:my\s+)?balance)\b', conversation_text):
-            falls_data['incident_type'] = 'loss_of_balance'
-        elif re.search(r'\b(dizzy|dizziness|lightheaded)\b', conversation_text):
-            falls_data['incident_type'] = 'dizzy_spell'
-        else:
+        incident_type = next((t for t in _FALL_INCIDENT_TYPES if t in facts), None)
+        if not incident_type:
             return None
+        falls_data['incident_type'] = incident_type
 
         # Location
-        locations = {
-            'bathroom': r'\b(bathroom|shower|bath|toilet)\b',
-            'bedroom': r'\bbedroom\b',
-            'kitchen': r'\bkitchen\b',
-            'stairs': r'\b(stairs|steps)\b',
-            'outside': r'\b(outside|yard|sidewalk|street)\b'
-        }
-        for loc, pattern in locations.items():
-            if re.search(pattern, conversation_text):
-                falls_data['location'] = loc
-                break
+        location = next((loc for loc in _FALL_LOCATIONS if loc in facts), None)
+        if location:
+            falls_data['location'] = location
 
         # Injury
-        if re.search(r'\b(hurt|injured|bruise|cut|pain|sore)\b', conversation_text):
+        if 'injured' in facts:
             falls_data['injured'] = True
             falls_data['severity'] = 'moderate'
 
         # Contributing factors
-        if re.search(r'\b(dizzy|dizziness)\b', conversation_text):
-            falls_data['felt_dizzy'] = True
-        if re.search(r'\b(tripped|trip)\b', conversation_text):
-            falls_data['tripped'] = True
-        if re.search(r'\b(slipped|slip)\b', conversation_text):
-            falls_data['slipped'] = True
-        if re.search(r'\b(weak|weakness|legs gave out)\b', conversation_text):
-            falls_data['weakness'] = True
+        for factor in ('felt_dizzy', 'tripped', 'slipped', 'weakness'):
+            if factor in facts:
+                falls_data[factor] = True
 
         return falls_data
 
-    def extract_condition_status(self, messages: List[Dict], senior_conditions: List[str] = None) -> List[Dict]:
+    def extract_condition_status(self, text_lower: str, senior_conditions: List[str] = None) -> List[Dict]:
         """
         Extract chronic condition status mentions
         Returns list of condition tracking dicts
+
+        Args:
+            text_lower: Lowercased message contents joined with spaces
+            senior_conditions: Conditions to look for (defaults to the common chronic ones)
         """
         if not senior_conditions:
-            senior_conditions = ['diabetes', 'hypertension', 'arthritis', 'copd', 'heart disease', 'asthma']
+            senior_conditions = _DEFAULT_CONDITIONS
 
-        conversation_text = " ".join([msg.get('content', '') for msg in messages]).lower()
         condition_updates = []
 
         for condition in senior_conditions:
             condition_lower = condition.lower()
 
-            # Check if condition mentioned
-            if condition_lower not in conversation_text:
+            # Check if condition mentioned (patterns are only compiled for conditions that come up)
+            if condition_lower not in text_lower:
                 continue
 
             condition_data = {
                 'condition_name': condition,
                 'status': 'stable'
             }
+            patterns = _condition_patterns(condition_lower)
 
             # Status indicators
-            if re.search(rf'{condition_lower}.*\b(worse|worsening|flare|flaring up|acting up)\b', conversation_text):
+            if patterns['worsening'].search(text_lower):
                 condition_data['status'] = 'worsening'
-            elif re.search(rf'{condition_lower}.*\b(better|improving|under control)\b', conversation_text):
+            elif patterns['improving'].search(text_lower):
                 condition_data['status'] = 'improving'
-            elif re.search(rf'{condition_lower}.*\b(flare-?up|bad day|really bad)\b', conversation_text):
+            elif patterns['flare_up'].search(text_lower):
                 condition_data['status'] = 'flare-up'
 
             # Symptoms
-            if re.search(rf'{condition_lower}.*\b(hurting|pain|swelling|trouble|difficult)\b', conversation_text):
+            if patterns['symptoms'].search(text_lower):
                 condition_data['symptoms_present'] = True
 
             # Impact on daily life
-            if re.search(r'\b(can\'?t|couldn\'?t|unable to|too hard to)\b', conversation_text):
+            if _LIMITED_ACTIVITIES_RE.search(text_lower):
                 condition_data['limited_activities'] = True
                 condition_data['impact_on_daily_life'] = 7  # Estimated high impact
 
@@ -341,26 +790,35 @@ class AnalyticsSyncService:
             'overall_score': None
         }
 
-        total_turns = len([m for m in messages if m['role'] == 'user'])
+        # One pass over the user messages for turn count and word total
+        user_messages = []
+        total_words = 0
+        for message in messages:
+            if message['role'] != 'user':
+                continue
+            content = message['content']
+            user_messages.append(content)
+            total_words += len(content.split())
+        total_turns = len(user_messages)
 
         if total_turns >= 5:
-            user_messages = [m['content'] for m in messages if m['role'] == 'user']
+            # Cue searches run once over all user text; newline-joined so no cue
+            # (all single-line phrases) can span two messages
+            user_text = "\n".join(user_messages)
+            has_memory_refs = _MEMORY_REF_RE.search(user_text) is not None
+            has_planning = _PLANNING_RE.search(user_text) is not None
 
             # Language score: based on response length and coherence
-            avg_length = sum(len(m.split()) for m in user_messages) / len(user_messages) if user_messages else 0
+            avg_length = total_words / total_turns
             scores['language_score'] = min(100, int(avg_length * 10))
 
             # Orientation score: assume good if responding appropriately
             scores['orientation_score'] = 85
 
             # Memory score: check if they reference previous info
-            has_memory_refs = any(re.search(r'\b(remember|last time|before|earlier)\b', m, re.IGNORECASE)
-                                 for m in user_messages)
             scores['memory_score'] = 90 if has_memory_refs else 75
 
             # Executive function: check if they can explain decisions/plans
-            has_planning = any(re.search(r'\b(will|going to|plan|later|tomorrow)\b', m, re.IGNORECASE)
-                              for m in user_messages)
             scores['executive_function_score'] = 85 if has_planning else 70
 
             # Overall score
@@ -370,299 +828,372 @@ class AnalyticsSyncService:
 
         return scores
 
+    def cognitive_scores_to_columns(self, cognitive_scores: Dict) -> Dict[str, any]:
+        """
+        Map post-call model scores (memory, orientation, language, executive)
+        to the cognitive_assessments columns used by extract_cognitive_indicators
+        """
+        scores = {
+            'memory_score': cognitive_scores['memory'],
+            'orientation_score': cognitive_scores['orientation'],
+            'language_score': cognitive_scores['language'],
+            'executive_function_score': cognitive_scores['executive'],
+            'coherence_score': None
+        }
+        scores['overall_score'] = int((scores['memory_score'] + scores['orientation_score'] +
+                                       scores['language_score'] + scores['executive_function_score']) / 4)
+        return scores
+
     # ============================================
     # SYNC METHODS
     # ============================================
 
+    def _copy_rows(self, cursor, table: str, columns: Tuple[str, ...], rows: List[Tuple]):
+        """Bulk-load rows into a table with COPY FROM STDIN (CSV; None becomes NULL)"""
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(
+            tuple(value.isoformat() if isinstance(value, datetime) else value for value in row)
+            for row in rows
+        )
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV)", buffer)
+
+    def _build_rows(self, session_data: Dict) -> Dict[str, List[Tuple]]:
+        """
+        Run all extractors for one session and build the rows to insert, per table
+
+        Returns dict keyed like _TABLE_INSERTS ('vitals', 'cognitive', 'call_summary', ...)
+        """
+        session_id = session_data['sessionId']
+        messages = session_data.get('messages', [])
+        metadata = session_data.get('metadata', {})
+        created_at = _parse_iso_timestamp(session_data['createdAt'])
+
+        # Get senior_id
+        senior_id = metadata.get('senior_id', session_id.split('-')[0])
+
+        rows = {table: [] for table in _TABLE_INSERTS}
+
+        # Conversation text is joined (and lowercased) once and shared by the extractors
+        conversation_text = " ".join([msg.get('content', '') for msg in messages])
+        conversation_text_lower = conversation_text.lower()
+        user_contents = [msg.get('content', '') for msg in messages if msg['role'] == 'user']
+        user_text_lower = " ".join(user_contents).lower()
+
+        # Skip the reminder and falls extractors when nothing could trigger them
+        triggers = _trigger_set(conversation_text_lower)
+
+        # Extract vitals. A reading repeated later in the call ("120/80" said twice)
+        # is one vital, recorded at its first mention
+        vitals = []
+        seen_readings = set()
+        medications_taken = None
+
+        for message in messages:
+            content = message.get('content', '')
+            raw_timestamp = message.get('timestamp')
+            timestamp = _parse_iso_timestamp(raw_timestamp) if raw_timestamp else created_at
+
+            message_vitals, meds = self._extract_vitals_from_message(content)
+            # Blood pressure is keyed on the whole (systolic, diastolic) pair, so
+            # both rows of a reading are kept or dropped together
+            bp_reading = tuple(value for vital_type, value, _ in message_vitals if vital_type.startswith('bp_'))
+            for vital_type, value, unit in message_vitals:
+                reading = (vital_type, bp_reading if vital_type.startswith('bp_') else value)
+                if reading not in seen_readings:
+                    seen_readings.add(reading)
+                    vitals.append((vital_type, value, unit, timestamp))
+
+            if meds is not None:
+                medications_taken = meds
+
+        rows['vitals'] = [
+            (senior_id, recorded_at, vital_type, vital_value, unit, 'call', session_id)
+            for vital_type, vital_value, unit, recorded_at in vitals
+        ]
+
+        # Cognitive assessment (model-scored when available)
+        if session_data.get('cognitiveScores'):
+            cog = self.cognitive_scores_to_columns(session_data['cognitiveScores'])
+        else:
+            cog = self.extract_cognitive_indicators(messages)
+        if cog['overall_score']:
+            rows['cognitive'].append((
+                senior_id,
+                created_at,
+                cog['memory_score'],
+                cog['orientation_score'],
+                cog['language_score'],
+                cog['executive_function_score'],
+                cog['overall_score'],
+                session_id
+            ))
+
+        # Generate summary text
+        summary_text = metadata.get('summary', '')
+        if not summary_text:
+            summary_parts = []
+            if vitals:
+                summary_parts.append(f"Collected {len(vitals)} vital signs")
+            if medications_taken is not None:
+                summary_parts.append("Medications: " + ("Taken" if medications_taken else "Missed"))
+            summary_parts.append(f"Conversation had {len(user_contents)} exchanges")
+            summary_text = ". ".join(summary_parts) if summary_parts else "Brief check-in"
+
+        rows['call_summary'].append((
+            senior_id,
+            created_at,
+            session_id,
+            metadata.get('call_duration'),
+            metadata.get('call_completed', True),
+            medications_taken,
+            summary_text
+        ))
+
+        # Medication log
+        if medications_taken is not None:
+            rows['medication'].append((senior_id, created_at.date(), medications_taken, session_id))
+
+        # Reminders
+        if 'reminders' in triggers:
+            try:
+                rows['reminders'] = [
+                    (
+                        senior_id,
+                        reminder.get('type', 'appointment'),
+                        reminder.get('title', 'Reminder'),
+                        reminder.get('description'),
+                        reminder.get('date'),
+                        reminder.get('priority', 'normal'),
+                        reminder.get('category', 'health'),
+                        'agent'
+                    )
+                    for reminder in self.extract_reminders(conversation_text)
+                ]
+            except Exception as reminder_error:
+                logger.warning(f"  ⚠️  Could not extract reminders: {reminder_error}")
+
+        # Activity data
+        try:
+            activity_data = self.extract_activity_data(user_text_lower)
+            if activity_data:
+                rows['activity'].append((
+                    senior_id,
+                    created_at.date(),
+                    activity_data.get('walked', False),
+                    activity_data.get('walk_duration_minutes'),
+                    activity_data.get('walk_distance'),
+                    activity_data.get('exercise_type'),
+                    activity_data.get('activity_level'),
+                    activity_data.get('left_house', False),
+                    activity_data.get('social_interaction', False),
+                    session_id
+                ))
+        except Exception as activity_error:
+            logger.warning(f"  ⚠️  Could not extract activity: {activity_error}")
+
+        # Falls data
+        try:
+            falls_data = self.extract_falls_data(conversation_text_lower) if 'falls' in triggers else None
+            if falls_data:
+                rows['falls'].append((
+                    senior_id,
+                    created_at,
+                    falls_data.get('incident_type'),
+                    falls_data.get('location'),
+                    falls_data.get('injured', False),
+                    falls_data.get('felt_dizzy', False),
+                    falls_data.get('tripped', False),
+                    falls_data.get('slipped', False),
+                    falls_data.get('weakness', False),
+                    falls_data.get('severity', 'minor'),
+                    session_id
+                ))
+                logger.info(f"  ⚠️  ALERT: Fall incident recorded - {falls_data.get('incident_type')} (session {session_id})")
+        except Exception as falls_error:
+            logger.warning(f"  ⚠️  Could not extract falls data: {falls_error}")
+
+        # Chronic condition tracking
+        try:
+            rows['conditions'] = [
+                (
+                    senior_id,
+                    created_at.date(),
+                    condition.get('condition_name'),
+                    condition.get('status', 'stable'),
+                    condition.get('symptoms_present', False),
+                    condition.get('limited_activities', False),
+                    condition.get('impact_on_daily_life'),
+                    session_id
+                )
+                for condition in self.extract_condition_status(conversation_text_lower)
+            ]
+        except Exception as condition_error:
+            logger.warning(f"  ⚠️  Could not extract condition status: {condition_error}")
+
+        return rows
+
+    def _write_rows(self, cursor, rows: Dict[str, List[Tuple]]):
+        """Insert the rows built by _build_rows: one statement (or COPY) per table"""
+        for table, table_rows in rows.items():
+            if not table_rows:
+                continue
+
+            sql, conflict_key = _TABLE_INSERTS[table]
+            if conflict_key:
+                # An upsert can't touch the same row twice in one statement -
+                # keep the last row per key, matching one-at-a-time semantics
+                table_rows = list({tuple(row[i] for i in conflict_key): row for row in table_rows}.values())
+
+            if table == 'vitals' and len(table_rows) >= self.COPY_MIN_ROWS:
+                self._copy_rows(
+                    cursor, 'senior_vitals',
+                    ('senior_id', 'recorded_at', 'vital_type', 'vital_value', 'unit', 'source', 'session_id'),
+                    table_rows
+                )
+            else:
+                execute_values(cursor, sql, table_rows, page_size=500)
+            logger.info(f"  ✅ Inserted {len(table_rows)} {table} rows")
+
     def sync_conversation(self, session_data: Dict) -> bool:
         """
         Sync a conversation to PostgreSQL analytics database
         Call this after call ends and summary is generated
 
         Args:
-            session_data: Full session dict from Cosmos DB with messages and metadata
+            session_data: Full session dict from Cosmos DB with messages and metadata.
+                Messages without a 'timestamp' are recorded at the session's createdAt.
+                Optional 'cognitiveScores' (post-call model scores) replace the keyword heuristic.
 
         Returns:
             True if sync successful, False otherwise
         """
-        if not self.pg_conn:
+        return self.sync_conversations_batch([session_data]) == 1
+
+    def sync_conversations_batch(self, sessions: List[Dict]) -> int:
+        """
+        Sync many conversations in one transaction (backfills, retries)
+
+        Rows from all sessions are merged per table, so the whole batch costs one
+        insert per table and a single commit
+
+        Args:
+            sessions: Session dicts in the same shape sync_conversation takes
+
+        Returns:
+            Number of distinct sessions now present in the analytics database
+            (already-synced sessions count; 0 if the batch failed)
+        """
+        if not self._pool:
             logger.error("No PostgreSQL connection available")
-            return False
+            return 0
 
+        session_ids = [session['sessionId'] for session in sessions]
         try:
-            cursor = self.pg_conn.cursor()
+            built = {}
+            for session in sessions:
+                session_id = session['sessionId']
+                if session_id not in built:  # Same session listed twice
+                    logger.info(f"🔄 Syncing session {session_id} to PostgreSQL...")
+                    built[session_id] = self._build_rows(session)
+        except Exception as e:
+            logger.error(f"❌ Failed to sync session(s) {', '.join(session_ids)}: {e}")
+            return 0
 
-            session_id = session_data['sessionId']
-            messages = session_data.get('messages', [])
-            metadata = session_data.get('metadata', {})
-            created_at = datetime.fromisoformat(session_data['createdAt'].replace('Z', '+00:00'))
+        for attempt in range(1, self.SYNC_ATTEMPTS + 1):
+            conn = None
+            dropped = False
+            try:
+                conn = self._pool.getconn()
+                inserted = self._write_batch(conn, built)
+
+                logger.info(f"✅ Successfully synced {len(inserted)} session(s) to PostgreSQL")
+                return len(built)
+
+            except (OperationalError, InterfaceError) as e:
+                # Retrying is safe: sessions a lost commit did store are skipped
+                # by the call summary's ON CONFLICT on the next attempt
+                dropped = True
+                if attempt < self.SYNC_ATTEMPTS:
+                    logger.warning(f"⚠️  PostgreSQL connection lost (attempt {attempt}/{self.SYNC_ATTEMPTS}), retrying on a fresh connection: {e}")
+                    continue
+                logger.error(f"❌ Failed to sync session(s) {', '.join(session_ids)}: {e}")
+                return 0
+
+            except Exception as e:
+                logger.error(f"❌ Failed to sync session(s) {', '.join(session_ids)}: {e}")
+                if conn and not conn.closed:
+                    conn.rollback()
+                return 0
+
+            finally:
+                if conn:
+                    # Dropped connections are discarded instead of handed to the next sync
+                    self._pool.putconn(conn, close=dropped or bool(conn.closed))
+
+    def _write_batch(self, conn, built: Dict[str, Dict[str, List[Tuple]]]) -> set:
+        """
+        Insert the rows of a batch and commit
 
-            # Get senior_id
-            senior_id = metadata.get('senior_id', session_id.split('-')[0])
+        Args:
+            conn: Connection borrowed from the pool
+            built: _build_rows output per session ID
 
-            # Check if already synced (avoid duplicates)
-            cursor.execute("SELECT 1 FROM call_summary WHERE session_id = %s LIMIT 1", (session_id,))
-            if cursor.fetchone():
-                logger.info(f"Session {session_id} already synced, skipping")
-                return True
+        Returns:
+            IDs of the sessions that were newly inserted
+        """
+        cursor = conn.cursor()
+
+        # The call summary insert doubles as the duplicate check: sessions
+        # that already have a summary are skipped by ON CONFLICT, and only
+        # the newly inserted ones come back from RETURNING
+        sql, _ = _TABLE_INSERTS['call_summary']
+        summary_rows = [row for rows in built.values() for row in rows['call_summary']]
+        inserted = {row[0] for row in execute_values(cursor, sql, summary_rows, page_size=500, fetch=True)}
+        for session_id in built.keys() - inserted:
+            logger.info(f"Session {session_id} already synced, skipping")
+
+        rows = {table: [] for table in _TABLE_INSERTS if table != 'call_summary'}
+        for session_id in built:  # Session order, so later upserts win
+            if session_id not in inserted:
+                continue
+            for table in rows:
+                rows[table].extend(built[session_id][table])
 
-            logger.info(f"🔄 Syncing session {session_id} to PostgreSQL...")
+        self._write_rows(cursor, rows)
+        conn.commit()
+        cursor.close()
+        return inserted
 
-            # Extract vitals
-            vitals = []
-            medications_taken = None
 
-            for message in messages:
-                content = message.get('content', '')
-                timestamp = datetime.fromisoformat(message['timestamp'].replace('Z', '+00:00'))
-
-                # Blood pressure
-                bp = self.extract_blood_pressure(content)
-                if bp:
-                    vitals.append({
-                        'vital_type': 'bp_systolic',
-                        'vital_value': bp[0],
-                        'unit': 'mmHg',
-                        'recorded_at': timestamp
-                    })
-                    vitals.append({
-                        'vital_type': 'bp_diastolic',
-                        'vital_value': bp[1],
-                        'unit': 'mmHg',
-                        'recorded_at': timestamp
-                    })
-
-                # Heart rate
-                hr = self.extract_heart_rate(content)
-                if hr:
-                    vitals.append({
-                        'vital_type': 'heart_rate',
-                        'vital_value': hr,
-                        'unit': 'bpm',
-                        'recorded_at': timestamp
-                    })
-
-                # Sleep hours
-                sleep = self.extract_sleep_hours(content)
-                if sleep:
-                    vitals.append({
-                        'vital_type': 'sleep_hours',
-                        'vital_value': sleep,
-                        'unit': 'hours',
-                        'recorded_at': timestamp
-                    })
-
-                # Pain level
-                pain = self.extract_pain_level(content)
-                if pain:
-                    vitals.append({
-                        'vital_type': 'pain_level',
-                        'vital_value': pain,
-                        'unit': 'scale',
-                        'recorded_at': timestamp
-                    })
-
-                # Medications
-                meds = self.extract_medications_taken(content)
-                if meds is not None:
-                    medications_taken = meds
-
-            # Insert vitals
-            if vitals:
-                vitals_data = [
-                    (senior_id, v['recorded_at'], v['vital_type'], v['vital_value'], v['unit'], 'call', session_id)
-                    for v in vitals
-                ]
-                execute_values(
-                    cursor,
-                    "INSERT INTO senior_vitals (senior_id, recorded_at, vital_type, vital_value, unit, source, session_id) VALUES %s",
-                    vitals_data
-                )
-                logger.info(f"  ✅ Inserted {len(vitals)} vitals")
+def _sync_batch_in_worker(sessions: List[Dict]) -> int:
+    """Backfill worker entry point: sync one chunk on this process's own pool"""
+    return AnalyticsSyncService().sync_conversations_batch(sessions)
 
-            # Insert cognitive assessment
-            cog = self.extract_cognitive_indicators(messages)
-            if cog['overall_score']:
-                cursor.execute("""
-                    INSERT INTO cognitive_assessments
-                    (senior_id, assessment_date, memory_score, orientation_score, language_score,
-                     executive_function_score, overall_score, session_id)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    senior_id,
-                    created_at,
-                    cog['memory_score'],
-                    cog['orientation_score'],
-                    cog['language_score'],
-                    cog['executive_function_score'],
-                    cog['overall_score'],
-                    session_id
-                ))
-                logger.info(f"  ✅ Inserted cognitive assessment (score: {cog['overall_score']})")
-
-            # Generate summary text
-            summary_text = metadata.get('summary', '')
-            if not summary_text:
-                summary_parts = []
-                if vitals:
-                    summary_parts.append(f"Collected {len(vitals)} vital signs")
-                if medications_taken is not None:
-                    summary_parts.append("Medications: " + ("Taken" if medications_taken else "Missed"))
-                summary_parts.append(f"Conversation had {len([m for m in messages if m['role'] == 'user'])} exchanges")
-                summary_text = ". ".join(summary_parts) if summary_parts else "Brief check-in"
-
-            # Insert call summary
-            cursor.execute("""
-                INSERT INTO call_summary
-                (senior_id, call_date, session_id, call_duration, call_completed,
-                 medication_adherence, summary_text)
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-            """, (
-                senior_id,
-                created_at,
-                session_id,
-                metadata.get('call_duration'),
-                metadata.get('call_completed', True),
-                medications_taken,
-                summary_text
-            ))
-            logger.info(f"  ✅ Inserted call summary")
 
-            # Insert medication log
-            if medications_taken is not None:
-                cursor.execute("""
-                    INSERT INTO medication_adherence
-                    (senior_id, log_date, medications_taken, session_id)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (senior_id, log_date) DO UPDATE
-                    SET medications_taken = EXCLUDED.medications_taken
-                """, (
-                    senior_id,
-                    created_at.date(),
-                    medications_taken,
-                    session_id
-                ))
-                logger.info(f"  ✅ Inserted medication log")
+def backfill_sessions(sessions: List[Dict], processes: Optional[int] = None, chunk_size: int = 32) -> int:
+    """
+    Sync historic sessions across a pool of worker processes
 
-            # Extract and insert reminders
-            try:
-                extracted_reminders = self.extract_reminders(messages)
-                if extracted_reminders:
-                    for reminder in extracted_reminders:
-                        cursor.execute("""
-                            INSERT INTO senior_reminders
-                            (senior_id, reminder_type, title, description, reminder_date,
-                             priority, category, created_by)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                        """, (
-                            senior_id,
-                            reminder.get('type', 'appointment'),
-                            reminder.get('title', 'Reminder'),
-                            reminder.get('description'),
-                            reminder.get('date'),
-                            reminder.get('priority', 'normal'),
-                            reminder.get('category', 'health'),
-                            'agent'
-                        ))
-                    logger.info(f"  ✅ Inserted {len(extracted_reminders)} reminders")
-            except Exception as reminder_error:
-                logger.warning(f"  ⚠️  Could not extract reminders: {reminder_error}")
+    Extraction is CPU-bound regex work, so a single process tops out at one core.
+    Each worker opens its own connection pool and syncs chunks of chunk_size
+    sessions with sync_conversations_batch (one transaction per chunk).
 
-            # Extract and insert activity data
-            try:
-                activity_data = self.extract_activity_data(messages)
-                if activity_data:
-                    cursor.execute("""
-                        INSERT INTO senior_activity
-                        (senior_id, activity_date, walked, walk_duration_minutes, walk_distance,
-                         exercise_type, activity_level, left_house, social_interaction, session_id)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (senior_id, activity_date) DO UPDATE
-                        SET walked = EXCLUDED.walked,
-                            walk_duration_minutes = EXCLUDED.walk_duration_minutes,
-                            walk_distance = EXCLUDED.walk_distance,
-                            exercise_type = EXCLUDED.exercise_type,
-                            activity_level = EXCLUDED.activity_level,
-                            left_house = EXCLUDED.left_house,
-                            social_interaction = EXCLUDED.social_interaction
-                    """, (
-                        senior_id,
-                        created_at.date(),
-                        activity_data.get('walked', False),
-                        activity_data.get('walk_duration_minutes'),
-                        activity_data.get('walk_distance'),
-                        activity_data.get('exercise_type'),
-                        activity_data.get('activity_level'),
-                        activity_data.get('left_house', False),
-                        activity_data.get('social_interaction', False),
-                        session_id
-                    ))
-                    logger.info(f"  ✅ Inserted activity data")
-            except Exception as activity_error:
-                logger.warning(f"  ⚠️  Could not extract activity: {activity_error}")
-
-            # Extract and insert falls data
-            try:
-                falls_data = self.extract_falls_data(messages)
-                if falls_data:
-                    cursor.execute("""
-                        INSERT INTO senior_falls
-                        (senior_id, incident_date, incident_type, location, injured,
-                         felt_dizzy, tripped, slipped, weakness, severity, session_id)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """, (
-                        senior_id,
-                        created_at,
-                        falls_data.get('incident_type'),
-                        falls_data.get('location'),
-                        falls_data.get('injured', False),
-                        falls_data.get('felt_dizzy', False),
-                        falls_data.get('tripped', False),
-                        falls_data.get('slipped', False),
-                        falls_data.get('weakness', False),
-                        falls_data.get('severity', 'minor'),
-                        session_id
-                    ))
-                    logger.info(f"  ⚠️  ALERT: Fall incident recorded - {falls_data.get('incident_type')}")
-            except Exception as falls_error:
-                logger.warning(f"  ⚠️  Could not extract falls data: {falls_error}")
-
-            # Extract and insert chronic condition tracking
-            try:
-                condition_updates = self.extract_condition_status(messages)
-                if condition_updates:
-                    for condition in condition_updates:
-                        cursor.execute("""
-                            INSERT INTO condition_tracking
-                            (senior_id, tracking_date, condition_name, status, symptoms_present,
-                             limited_activities, impact_on_daily_life, session_id)
-                            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                            ON CONFLICT (senior_id, tracking_date, condition_name) DO UPDATE
-                            SET status = EXCLUDED.status,
-                                symptoms_present = EXCLUDED.symptoms_present,
-                                limited_activities = EXCLUDED.limited_activities,
-                                impact_on_daily_life = EXCLUDED.impact_on_daily_life
-                        """, (
-                            senior_id,
-                            created_at.date(),
-                            condition.get('condition_name'),
-                            condition.get('status', 'stable'),
-                            condition.get('symptoms_present', False),
-                            condition.get('limited_activities', False),
-                            condition.get('impact_on_daily_life'),
-                            session_id
-                        ))
-                    logger.info(f"  ✅ Inserted {len(condition_updates)} condition updates")
-            except Exception as condition_error:
-                logger.warning(f"  ⚠️  Could not extract condition status: {condition_error}")
-
-            self.pg_conn.commit()
-            cursor.close()
-            logger.info(f"✅ Successfully synced session {session_id} to PostgreSQL")
-            return True
+    Args:
+        sessions: Session dicts in the same shape sync_conversation takes
+        processes: Worker count (default os.cpu_count(); keep it under the
+            PostgreSQL connection limit)
+        chunk_size: Sessions per worker transaction
 
-        except Exception as e:
-            logger.error(f"❌ Failed to sync session {session_id}: {e}")
-            if self.pg_conn:
-                self.pg_conn.rollback()
-            return False
+    Returns:
+        Number of sessions present in the analytics database afterwards
+    """
+    chunks = [sessions[i:i + chunk_size] for i in range(0, len(sessions), chunk_size)]
+    if not chunks:
+        return 0
+
+    with Pool(processes) as workers:
+        synced = sum(workers.imap_unordered(_sync_batch_in_worker, chunks))
+
+    logger.info(f"✅ Backfilled {synced}/{len(sessions)} session(s) to PostgreSQL")
+    return synced
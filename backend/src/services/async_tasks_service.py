@@ -7,8 +7,8 @@ Handles background tasks that don't need to block the conversation
 """
 import logging
 import threading
-from typing import Dict, List, Callable
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Callable, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -17,29 +17,41 @@ logger = logging.getLogger(__name__)
 class AsyncTasksService:
     """Service to handle background tasks asynchronously"""
 
+    # Tasks are IO-bound (web search, SMTP, PostgreSQL), so a slow one
+    # shouldn't hold up the rest
+    MAX_WORKERS = 4
+
     def __init__(self):
-        """Initialize async task queue"""
-        self.task_queue = Queue()
-        self.worker_thread = None
+        """Initialize async task pool"""
+        self.executor: Optional[ThreadPoolExecutor] = None
         self.running = False
+        # Tasks queued before the workers start (submitted by start_worker)
+        self._held_tasks: List[Dict] = []
+        self._pending = 0
+        self._lock = threading.Lock()
 
     def start_worker(self):
-        """Start background worker thread"""
-        if self.running:
-            logger.warning("Worker already running")
-            return
-
-        self.running = True
-        self.worker_thread = threading.Thread(target=self._process_tasks, daemon=True)
-        self.worker_thread.start()
-        logger.info("✅ Async task worker started")
+        """Start background worker threads"""
+        with self._lock:
+            if self.running:
+                logger.warning("Worker already running")
+                return
+
+            self.running = True
+            self.executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix='async-task')
+            held_tasks, self._held_tasks = self._held_tasks, []
+            for task in held_tasks:
+                self.executor.submit(self._run_task, task)
+        logger.info(f"✅ Async task workers started ({self.MAX_WORKERS} threads)")
 
     def stop_worker(self):
-        """Stop background worker thread"""
-        self.running = False
-        if self.worker_thread:
-            self.worker_thread.join(timeout=5)
-        logger.info("🛑 Async task worker stopped")
+        """Stop background worker threads (tasks already queued still run)"""
+        with self._lock:
+            self.running = False
+            executor, self.executor = self.executor, None
+        if executor:
+            executor.shutdown(wait=False)
+        logger.info("🛑 Async task workers stopped")
 
     def queue_task(self, task_name: str, task_func: Callable, *args, **kwargs):
         """
@@ -58,42 +70,33 @@ class AsyncTasksService:
             'queued_at': datetime.now()
         }
 
-        self.task_queue.put(task)
+        with self._lock:
+            self._pending += 1
+            if self.running:
+                self.executor.submit(self._run_task, task)
+            else:
+                self._held_tasks.append(task)
         logger.info(f"📝 Queued async task: {task_name}")
 
-    def _process_tasks(self):
-        """Worker thread that processes tasks from queue"""
-        logger.info("🔄 Task processor started")
-
-        while self.running:
-            try:
-                # Get task from queue (block for 1 second)
-                task = self.task_queue.get(timeout=1)
-
-                logger.info(f"⚙️  Processing task: {task['name']}")
+    def _run_task(self, task: Dict):
+        """Run one queued task on a worker thread"""
+        with self._lock:
+            self._pending -= 1
 
-                # Execute the task
-                try:
-                    result = task['func'](*task['args'], **task['kwargs'])
+        logger.info(f"⚙️  Processing task: {task['name']}")
 
-                    queued_time = (datetime.now() - task['queued_at']).total_seconds()
-                    logger.info(f"✅ Task completed: {task['name']} (queued for {queued_time:.1f}s)")
-
-                except Exception as task_error:
-                    logger.error(f"❌ Task failed: {task['name']} - {task_error}")
-
-                finally:
-                    self.task_queue.task_done()
+        try:
+            task['func'](*task['args'], **task['kwargs'])
 
-            except:
-                # Queue timeout - continue loop
-                continue
+            queued_time = (datetime.now() - task['queued_at']).total_seconds()
+            logger.info(f"✅ Task completed: {task['name']} (queued for {queued_time:.1f}s)")
 
-        logger.info("🔄 Task processor stopped")
+        except Exception as task_error:
+            logger.error(f"❌ Task failed: {task['name']} - {task_error}")
 
     def get_queue_size(self) -> int:
         """Get number of pending tasks"""
-        return self.task_queue.qsize()
+        return self._pending
 
 
 # Global instance
@@ -112,6 +115,43 @@ def queue_email_send(email_service, recipient: str, subject: str, content: str):
     )
 
 
+def queue_analytics_sync(
+    sync_service,
+    session_data: Dict,
+    score_cognition: Optional[Callable[[List[Dict]], Optional[Dict]]] = None
+):
+    """
+    Queue a PostgreSQL analytics sync for a finished call
+
+    Args:
+        sync_service: AnalyticsSyncService instance (closed once the sync has run)
+        session_data: Session dict in the shape sync_conversation takes
+        score_cognition: Optional scorer run on session_data['messages'] before the
+            sync; the result is stored as 'cognitiveScores'. It runs on the worker
+            so the model request doesn't hold up the end of the call.
+    """
+
+    def do_sync():
+        """Score (if requested), sync the session and report the outcome"""
+        try:
+            if score_cognition:
+                session_data['cognitiveScores'] = score_cognition(session_data['messages'])
+            success = sync_service.sync_conversation(session_data)
+        finally:
+            sync_service.close()
+
+        if success:
+            logger.info(f"✅ Analytics data synced to PostgreSQL ({session_data['sessionId']})")
+        else:
+            logger.warning(f"⚠️  Failed to sync analytics data ({session_data['sessionId']})")
+        return success
+
+    async_tasks.queue_task(
+        task_name=f"Sync analytics for session {session_data['sessionId']}",
+        task_func=do_sync
+    )
+
+
 def queue_research_email(
     email_service,
     research_service,
@@ -2,18 +2,57 @@
 AWS Connect Service
 Handles outbound calling and call management using Amazon Connect
 """
+import asyncio
 import boto3
+from botocore.config import Config
 import logging
-from typing import Optional, Dict, Any
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import uuid
+from src.config import config
 
 logger = logging.getLogger(__name__)
 
+# Connect client transport: enough pooled connections for bursts of concurrent
+# outbound calls (the botocore default of 10 forces fresh TLS handshakes beyond
+# that), TCP keep-alive on idle sockets, and bounded timeouts
+_CONNECT_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=15,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+# Everything _format_phone_number strips (dashes, spaces, parentheses, '+')
+_NON_DIGITS_RE = re.compile(r'\D+')
+
+# Threads for the *_async methods, shared by every AWSConnectService (one is
+# built per dial); calls just wait on AWS, so size for I/O rather than the
+# executor default of cpu_count() + 4. Threads only start once used.
+_CONNECT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=max(32, (os.cpu_count() or 4) * 5),
+    thread_name_prefix='connect'
+)
+
+# Resolved contact flow IDs, shared by every AWSConnectService for the same
+# reason as the executor: instance_id -> (flow ID, time.monotonic() when
+# resolved). The hardcoded fallback is never cached.
+_FLOW_ID_CACHE: Dict[str, Tuple[str, float]] = {}
+_FLOW_ID_LOCK = threading.Lock()
+
 
 class AWSConnectService:
     """Manages outbound calls through Amazon Connect"""
 
+    # How long a resolved contact flow ID is reused before listing flows again
+    FLOW_ID_TTL_SECONDS = 300
+
     def __init__(self, region: str, instance_id: str, access_key: str, secret_key: str, phone_number: str):
         """
         Initialize AWS Connect Service
@@ -36,7 +75,9 @@ class AWSConnectService:
             region_name=region
         )
 
-        self.connect_client = session.client('connect')
+        self.connect_client = session.client('connect', config=_CONNECT_CLIENT_CONFIG)
+
+        self._executor = _CONNECT_EXECUTOR
 
         logger.info("AWS Connect Service initialized")
 
@@ -58,10 +99,6 @@ class AWSConnectService:
 
             logger.info("Initiating outbound call (senior name suppressed)")
 
-            # Get AI agent name from config
-            from src.config import config
-            ai_name = config.get_ai_name()
-
             # Start outbound voice contact
             response = self.connect_client.start_outbound_voice_contact(
                 DestinationPhoneNumber=formatted_destination,
@@ -70,7 +107,7 @@ class AWSConnectService:
                 SourcePhoneNumber=formatted_source,
                 Attributes={
                     'senior_name': senior_name,
-                    'ai_name': ai_name,
+                    'ai_name': config.get_ai_name(),
                     'call_purpose': 'daily_wellness_check',
                     'timestamp': datetime.utcnow().isoformat()
                 }
@@ -90,6 +127,8 @@ class AWSConnectService:
 
         except Exception as e:
             logger.error(f"Failed to initiate outbound call: {e}")
+            # The cached flow may have been deleted or renamed; re-resolve on the next dial
+            self.refresh_contact_flow_id()
             return {
                 'success': False,
                 'error': str(e),
@@ -133,6 +172,25 @@ class AWSConnectService:
                 'contact_id': contact_id
             }
 
+    def get_call_statuses(self, contact_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Get the current status of several calls at once
+
+        Connect has no batch form of describe_contact, so the lookups are issued
+        in parallel on the service's thread pool (boto3 clients are thread-safe)
+        and a polling round costs one round-trip instead of one per call
+
+        Args:
+            contact_ids: Contact IDs from initiate_outbound_call
+
+        Returns:
+            get_call_status results, in the same order as contact_ids
+        """
+        if len(contact_ids) <= 1:
+            return [self.get_call_status(contact_id) for contact_id in contact_ids]
+
+        return list(self._executor.map(self.get_call_status, contact_ids))
+
     def end_call(self, contact_id: str) -> bool:
         """
         End an active call
@@ -156,6 +214,28 @@ class AWSConnectService:
             logger.error(f"Failed to end call: {e}")
             return False
 
+    # ============================================
+    # ASYNCIO WRAPPERS (boto3 calls run on self._executor)
+    # ============================================
+
+    async def initiate_outbound_call_async(self, destination_phone: str, senior_name: str) -> Dict[str, Any]:
+        """initiate_outbound_call without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.initiate_outbound_call, destination_phone, senior_name
+        )
+
+    async def get_call_status_async(self, contact_id: str) -> Dict[str, Any]:
+        """get_call_status without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.get_call_status, contact_id
+        )
+
+    async def end_call_async(self, contact_id: str) -> bool:
+        """end_call without blocking the event loop"""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, self.end_call, contact_id
+        )
+
     def _format_phone_number(self, phone: str) -> str:
         """
         Format phone number for AWS Connect
@@ -167,7 +247,7 @@ class AWSConnectService:
             Phone number in E.164 format (+1XXXXXXXXXX)
         """
         # Remove all non-digit characters
-        digits_only = ''.join(filter(str.isdigit, phone))
+        digits_only = _NON_DIGITS_RE.sub('', phone)
 
         # Add +1 if not present (assuming US/Canada numbers)
         if len(digits_only) == 10:
@@ -181,42 +261,80 @@ class AWSConnectService:
         """
         Get the AI Voice Agent contact flow ID for outbound calls
         Uses our custom contact flow specifically designed for AI voice agent
+
+        The resolved ID is cached for FLOW_ID_TTL_SECONDS, so repeat calls
+        skip the list_contact_flows round-trip
+        """
+        with _FLOW_ID_LOCK:
+            cached = _FLOW_ID_CACHE.get(self.instance_id)
+            if cached:
+                flow_id, resolved_at = cached
+                if time.monotonic() - resolved_at < self.FLOW_ID_TTL_SECONDS:
+                    return flow_id
+
+            flow_id = self._lookup_contact_flow_id()
+            if flow_id:
+                _FLOW_ID_CACHE[self.instance_id] = (flow_id, time.monotonic())
+                return flow_id
+
+        # Return the Seniorly Voice Agent Simple flow (with Polly TTS) as fallback
+        logger.info("Using Seniorly Voice Agent Simple flow as fallback")
+        return "ad8aab03-abc1-46bf-bae4-fdcb061bf27b"
+
+    def refresh_contact_flow_id(self):
+        """Drop this instance's cached contact flow ID (e.g. after flows are edited in Connect)"""
+        with _FLOW_ID_LOCK:
+            _FLOW_ID_CACHE.pop(self.instance_id, None)
+
+    def _lookup_contact_flow_id(self) -> Optional[str]:
+        """
+        List the instance's contact flows and pick the one to use for outbound calls
+
+        Returns:
+            Contact flow ID, or None if the lookup failed
         """
         try:
-            # First try to find our custom AI Voice Agent contact flow
-            response = self.connect_client.list_contact_flows(
+            # list_contact_flows returns at most 100 flows per page, so walk every
+            # page until our custom AI Voice Agent contact flow turns up
+            paginator = self.connect_client.get_paginator('list_contact_flows')
+            pages = paginator.paginate(
                 InstanceId=self.instance_id,
-                ContactFlowTypes=['CONTACT_FLOW']
+                ContactFlowTypes=['CONTACT_FLOW'],
+                PaginationConfig={'PageSize': 100}
             )
 
-            # Look for our custom AI Voice Agent flow first
-            for flow in response['ContactFlowSummaryList']:
-                if 'AI Voice Agent' in flow['Name']:
-                    logger.info(f"Using AI Voice Agent contact flow: {flow['Id']}")
-                    return flow['Id']
+            fallback_flow = None
+            first_flow = None
+            for page in pages:
+                for flow in page['ContactFlowSummaryList']:
+                    # Look for our custom AI Voice Agent flow first
+                    if 'AI Voice Agent' in flow['Name']:
+                        logger.info(f"Using AI Voice Agent contact flow: {flow['Id']}")
+                        return flow['Id']
 
-            # Fall back to any simple/basic flow (avoid complex queue flows)
-            for flow in response['ContactFlowSummaryList']:
-                flow_name = flow['Name'].lower()
-                if ('simple' in flow_name or 'basic' in flow_name or
-                    'test' in flow_name or 'inbound' in flow_name):
-                    logger.info(f"Using fallback contact flow: {flow['Id']} ({flow['Name']})")
-                    return flow['Id']
+                    if first_flow is None:
+                        first_flow = flow
+
+                    # Remember the first simple/basic flow (avoid complex queue flows)
+                    flow_name = flow['Name'].lower()
+                    if fallback_flow is None and ('simple' in flow_name or 'basic' in flow_name or
+                                                  'test' in flow_name or 'inbound' in flow_name):
+                        fallback_flow = flow
+
+            if fallback_flow:
+                logger.info(f"Using fallback contact flow: {fallback_flow['Id']} ({fallback_flow['Name']})")
+                return fallback_flow['Id']
 
             # Last resort: use the first available (but warn about it)
-            if response['ContactFlowSummaryList']:
-                flow_id = response['ContactFlowSummaryList'][0]['Id']
-                flow_name = response['ContactFlowSummaryList'][0]['Name']
-                logger.warning(f"Using first available contact flow: {flow_id} ({flow_name}) - may not work correctly")
-                return flow_id
+            if first_flow:
+                logger.warning(f"Using first available contact flow: {first_flow['Id']} ({first_flow['Name']}) - may not work correctly")
+                return first_flow['Id']
 
             raise Exception("No contact flows found")
 
         except Exception as e:
             logger.error(f"Failed to get contact flow ID: {e}")
-            # Return the Seniorly Voice Agent Simple flow (with Polly TTS) as fallback
-            logger.info("Using Seniorly Voice Agent Simple flow as fallback")
-            return "ad8aab03-abc1-46bf-bae4-fdcb061bf27b"
+            return None
 
     def _calculate_duration(self, contact: Dict) -> Optional[int]:
         """
@@ -3,21 +3,54 @@ Call Flow Service
 Manages structured todos for each call conversation
 Ensures the agent covers all necessary topics
 """
+import heapq
 import logging
 from typing import List, Dict, Optional
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Sort rank per todo priority (unknown priorities go last)
+_PRIORITY_ORDER = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+# Topic detection: a todo counts as covered when any of its keywords appears in
+# the exchange. Keywords that contain a shorter one of the same topic ('sleeping',
+# 'hours of sleep', 'walked', 'fallen', 'visitor', ...) are left out, since the
+# shorter keyword already matches them
+_TOPIC_KEYWORDS = (
+    ('vitals', ('blood pressure', 'bp', 'heart rate', 'pulse', 'weight')),
+    ('sleep', ('sleep', 'slept', 'insomnia')),
+    ('activity', ('walk', 'exercise', 'gardening', 'yoga', 'stretching')),
+    ('falls_safety', ('fall', 'fell', 'stumbled', 'dizzy', 'balance', 'unsteady')),
+    ('medications', ('medication', 'medicine', 'pills', 'prescr')),
+    ('social_connection', ('family', 'friend', 'talked to', 'call', 'visit')),
+    ('chronic_conditions', ('arthritis', 'diabetes', 'copd', 'hypertension', 'condition', 'symptoms')),
+    ('cognitive_check', ('day of the week', 'what month', 'count backwards', 'remember')),
+    ('reminders', ('reminder', 'appointment', 'doctor', 'dentist')),
+)
+
 
 class CallFlowService:
     """Service to manage call todos and ensure complete conversations"""
 
+    # Fixed frame around the per-turn guidance in get_context_for_ai
+    _CONTEXT_HEADER = (
+        "\n═══════════════════════════════════════════════════════\n"
+        "CALL FLOW GUIDANCE (INTERNAL - DO NOT MENTION TO SENIOR)\n"
+        "═══════════════════════════════════════════════════════"
+    )
+    _CONTEXT_FOOTER = "═══════════════════════════════════════════════════════\n"
+
     def __init__(self):
         """Initialize call flow tracking"""
         self.call_todos = []
         self.completed_todos = []
         self.current_turn = 0
+        # (priority rank, target turn, list index, todo) per todo; completed
+        # entries are dropped lazily once they reach the top
+        self._pending_heap = []
+        # get_completion_status result, cleared whenever a todo changes state
+        self._status_cache: Optional[Dict] = None
 
     def initialize_call_todos(self, senior_profile: Dict = None) -> List[Dict]:
         """
@@ -198,6 +231,13 @@ class CallFlowService:
                         ]
 
         self.call_todos = base_todos
+        # The list index keeps ties in list order (as a stable sort would)
+        self._pending_heap = [
+            (_PRIORITY_ORDER.get(todo['priority'], 4), todo['target_turn'], index, todo)
+            for index, todo in enumerate(base_todos)
+        ]
+        heapq.heapify(self._pending_heap)
+        self._status_cache = None
         return base_todos
 
     def mark_todo_completed(self, todo_id: str) -> bool:
@@ -205,6 +245,7 @@ class CallFlowService:
         for todo in self.call_todos:
             if todo['id'] == todo_id:
                 todo['completed'] = True
+                self._status_cache = None
                 self.completed_todos.append({
                     'id': todo_id,
                     'topic': todo['topic'],
@@ -216,33 +257,45 @@ class CallFlowService:
 
     def get_next_todo(self) -> Optional[Dict]:
         """Get the next pending todo based on priority and target turn"""
-        pending = [t for t in self.call_todos if not t['completed']]
+        heap = self._pending_heap
+        while heap and heap[0][3]['completed']:
+            heapq.heappop(heap)
 
-        if not pending:
-            return None
+        return heap[0][3] if heap else None
 
-        # Sort by priority and target turn
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        pending.sort(key=lambda x: (priority_order.get(x['priority'], 4), x['target_turn']))
+    def get_completion_status(self) -> Dict:
+        """
+        Get overall completion status
 
-        return pending[0]
+        Cached until the next initialize_call_todos / mark_todo_completed,
+        so the returned dict is shared and must not be modified
+        """
+        if self._status_cache is not None:
+            return self._status_cache
 
-    def get_completion_status(self) -> Dict:
-        """Get overall completion status"""
         total = len(self.call_todos)
-        completed = len([t for t in self.call_todos if t['completed']])
-        critical_todos = [t for t in self.call_todos if t['priority'] == 'critical']
-        critical_completed = len([t for t in critical_todos if t['completed']])
-
-        return {
+        critical_total = 0
+        critical_completed = 0
+        pending = []
+        for todo in self.call_todos:
+            is_critical = todo['priority'] == 'critical'
+            critical_total += is_critical
+            if todo['completed']:
+                critical_completed += is_critical
+            else:
+                pending.append(todo)
+        completed = total - len(pending)
+
+        self._status_cache = {
             'total': total,
             'completed': completed,
             'percentage': round((completed / total) * 100, 1) if total > 0 else 0,
-            'critical_total': len(critical_todos),
+            'critical_total': critical_total,
             'critical_completed': critical_completed,
-            'all_critical_done': critical_completed == len(critical_todos),
-            'pending': [t for t in self.call_todos if not t['completed']]
+            'all_critical_done': critical_completed == critical_total,
+            'pending': pending
         }
+        return self._status_cache
 
     def should_wrap_up(self) -> bool:
         """Determine if call should wrap up"""
@@ -268,32 +321,27 @@ class CallFlowService:
         next_todo = self.get_next_todo()
         status = self.get_completion_status()
 
-        lines = [
-            "\n═══════════════════════════════════════════════════════",
-            "CALL FLOW GUIDANCE (INTERNAL - DO NOT MENTION TO SENIOR)",
-            "═══════════════════════════════════════════════════════"
-        ]
+        lines = [self._CONTEXT_HEADER]
 
         if next_todo:
             lines.append(f"\n🎯 NEXT TOPIC TO COVER: {next_todo['topic']}")
             lines.append(f"   Priority: {next_todo['priority'].upper()}")
-            lines.append(f"   Example questions:")
-            for q in next_todo['questions'][:2]:
-                lines.append(f"   - {q}")
+            lines.append("   Example questions:")
+            lines.extend(f"   - {q}" for q in next_todo['questions'][:2])
 
-        lines.append(f"\n📊 Progress: {status['completed']}/{status['total']} topics covered ({status['percentage']}%)")
-        lines.append(f"   Critical topics: {status['critical_completed']}/{status['critical_total']}")
+        lines.append(
+            f"\n📊 Progress: {status['completed']}/{status['total']} topics covered ({status['percentage']}%)\n"
+            f"   Critical topics: {status['critical_completed']}/{status['critical_total']}"
+        )
 
-        pending_critical = [t for t in self.call_todos if not t['completed'] and t['priority'] == 'critical']
-        if pending_critical:
-            lines.append(f"\n⚠️  CRITICAL TOPICS STILL PENDING:")
-            for todo in pending_critical:
-                lines.append(f"   - {todo['topic']}")
+        if not status['all_critical_done']:
+            lines.append("\n⚠️  CRITICAL TOPICS STILL PENDING:")
+            lines.extend(f"   - {t['topic']}" for t in status['pending'] if t['priority'] == 'critical')
 
         if self.should_wrap_up():
-            lines.append(f"\n✅ All critical topics covered - you can wrap up naturally")
+            lines.append("\n✅ All critical topics covered - you can wrap up naturally")
 
-        lines.append("═══════════════════════════════════════════════════════\n")
+        lines.append(self._CONTEXT_FOOTER)
 
         return "\n".join(lines)
 
@@ -308,27 +356,12 @@ class CallFlowService:
         Returns:
             List of todo IDs that were covered
         """
-        covered = []
         combined_text = (user_message + " " + ai_message).lower()
 
-        # Detection patterns
-        patterns = {
-            'vitals': ['blood pressure', 'bp', 'heart rate', 'pulse', 'weight'],
-            'sleep': ['sleep', 'sleeping', 'slept', 'hours of sleep', 'insomnia'],
-            'activity': ['walk', 'walked', 'walking', 'exercise', 'gardening', 'yoga', 'stretching'],
-            'falls_safety': ['fall', 'fell', 'fallen', 'stumbled', 'dizzy', 'balance', 'unsteady'],
-            'medications': ['medication', 'medicine', 'pills', 'prescr'],
-            'social_connection': ['family', 'friend', 'visitor', 'talked to', 'call', 'visit'],
-            'chronic_conditions': ['arthritis', 'diabetes', 'copd', 'hypertension', 'condition', 'symptoms'],
-            'cognitive_check': ['day of the week', 'what month', 'count backwards', 'remember'],
-            'reminders': ['reminder', 'appointment', 'doctor', 'dentist']
-        }
-
-        for todo_id, keywords in patterns.items():
-            if any(keyword in combined_text for keyword in keywords):
-                covered.append(todo_id)
-
-        return covered
+        return [
+            todo_id for todo_id, keywords in _TOPIC_KEYWORDS
+            if any(keyword in combined_text for keyword in keywords)
+        ]
 
     def increment_turn(self):
         """Increment conversation turn counter"""
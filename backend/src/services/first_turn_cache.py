@@ -0,0 +1,85 @@
+"""
+First-Turn Response Cache
+Reuses the AI's reply to common opening answers ("I'm fine", "Not great", "Tired")
+Skips the model round-trip for the first turn of calls without per-senior context
+"""
+import logging
+import re
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Words that don't change the meaning of an opening answer
+_FILLER_WORDS = {"oh", "well", "um", "uh", "hmm", "hi", "hello", "hey", "so", "yeah", "yes", "thanks", "thank", "you"}
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+class FirstTurnCache:
+    """In-process LRU cache of first-turn replies"""
+
+    MAX_ENTRIES = 512
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        # (prompt_key, normalized utterance) -> AI reply
+        self._responses: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(utterance: str) -> str:
+        """
+        Reduce an utterance to its meaningful words so close variants share an entry
+        ("Oh, I'm fine, thank you!" and "im fine" -> "im fine")
+        """
+        words = _WORD_RE.findall(utterance.lower().replace("'", "").replace("’", ""))
+        return " ".join(word for word in words if word not in _FILLER_WORDS)
+
+    def get(self, prompt_key: str, utterance: str) -> Optional[str]:
+        """
+        Look up the reply for an opening answer
+
+        Args:
+            prompt_key: Identifies the prompt the reply was generated with (hash + AI name)
+            utterance: Senior's first answer
+
+        Returns:
+            Cached reply or None
+        """
+        normalized = self.normalize(utterance)
+        if not normalized:
+            return None
+
+        key = (prompt_key, normalized)
+        response = self._responses.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+
+        self._responses.move_to_end(key)
+        self.hits += 1
+        logger.info(f"First-turn cache hit ({self.hits} hits / {self.misses} misses)")
+        return response
+
+    def put(self, prompt_key: str, utterance: str, response: str):
+        """
+        Store the reply for an opening answer
+
+        Args:
+            prompt_key: Identifies the prompt the reply was generated with (hash + AI name)
+            utterance: Senior's first answer
+            response: AI reply (must not contain senior-specific details)
+        """
+        normalized = self.normalize(utterance)
+        if not normalized or not response:
+            return
+
+        self._responses[(prompt_key, normalized)] = response
+        self._responses.move_to_end((prompt_key, normalized))
+        if len(self._responses) > self.MAX_ENTRIES:
+            self._responses.popitem(last=False)
+
+
+# Global instance (shared by all calls in this process)
+first_turn_cache = FirstTurnCache()
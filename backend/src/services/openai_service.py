@@ -3,9 +3,12 @@ Azure OpenAI Service integration
 Handles GPT-5-CHAT conversational AI
 """
 from openai import AzureOpenAI
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+import json
 import logging
 
+from src.senior_health_prompt import prompt_hash
+
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +57,13 @@ class OpenAIService:
 You have natural conversations with users and provide accurate, concise responses.
 Keep your responses conversational and not too long since they will be spoken aloud.
 Be warm, engaging, and professional."""
+        # Messages sent ahead of the conversation on every request
+        self.system_messages: List[Dict[str, str]] = [{"role": "system", "content": self.system_prompt}]
+        self.system_prompt_hash = prompt_hash(self.system_prompt)
+
+        # Function tools offered to the model and the callback that runs them
+        self.tools: List[Dict] = []
+        self.tool_handler: Optional[Callable[[str, Dict], str]] = None
 
         logger.info(f"OpenAI Service initialized with deployment: {self.deployment_name}")
 
@@ -65,7 +75,66 @@ Be warm, engaging, and professional."""
             prompt: New system prompt
         """
         self.system_prompt = prompt
-        logger.info("System prompt updated")
+        self.system_messages = [{"role": "system", "content": prompt}]
+        self.system_prompt_hash = prompt_hash(prompt)
+        logger.info(f"System prompt updated (hash: {self.system_prompt_hash})")
+
+    def set_system_messages(self, messages: List[Dict[str, str]]):
+        """
+        Set the leading system messages (e.g. static prompt + per-call context)
+
+        Args:
+            messages: System messages sent ahead of the conversation, static first
+        """
+        self.system_messages = list(messages)
+        self.system_prompt = self.system_messages[0]["content"] if self.system_messages else ""
+        self.system_prompt_hash = prompt_hash(self.system_prompt)
+        logger.info(f"System messages updated ({len(self.system_messages)} messages, prompt hash: {self.system_prompt_hash})")
+
+    def set_tools(self, tools: List[Dict], handler: Callable[[str, Dict], str]):
+        """
+        Offer function tools to the model
+
+        Args:
+            tools: Tool definitions (Chat Completions "tools" format)
+            handler: Called as handler(name, arguments); returns the result text for the model
+        """
+        self.tools = list(tools)
+        self.tool_handler = handler
+        logger.info(f"Tools enabled: {[tool['function']['name'] for tool in self.tools]}")
+
+    def _run_tool_calls(self, messages: List[Dict], message) -> List[Dict]:
+        """
+        Run the tool calls in a model reply and append the exchange to messages
+
+        Args:
+            messages: Request messages (extended in place)
+            message: Assistant message containing tool_calls
+
+        Returns:
+            The extended messages list
+        """
+        messages.append({
+            "role": "assistant",
+            "content": message.content,
+            "tool_calls": [
+                {
+                    "id": call.id,
+                    "type": "function",
+                    "function": {"name": call.function.name, "arguments": call.function.arguments}
+                }
+                for call in message.tool_calls
+            ]
+        })
+        for call in message.tool_calls:
+            try:
+                arguments = json.loads(call.function.arguments or "{}")
+                result = self.tool_handler(call.function.name, arguments)
+            except Exception as e:
+                logger.error(f"Tool {call.function.name} failed: {e}")
+                result = "The request could not be completed."
+            messages.append({"role": "tool", "tool_call_id": call.id, "content": result})
+        return messages
 
     def trim_conversation_history(self, max_turns: int = 8):
         """
@@ -88,7 +157,13 @@ Be warm, engaging, and professional."""
         # Reconstruct: system messages first, then recent conversation
         self.conversation_history = system_messages + conversation
 
-    def chat(self, user_message: str, temperature: float = 0.7, max_tokens: int = 500) -> Optional[str]:
+    def chat(
+        self,
+        user_message: str,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        system_note: str = None
+    ) -> Optional[str]:
         """
         Send a message to GPT-5-CHAT and get a response
 
@@ -96,6 +171,7 @@ Be warm, engaging, and professional."""
             user_message: User's input message
             temperature: Sampling temperature (0-1, higher = more creative)
             max_tokens: Maximum tokens in response
+            system_note: Instruction for this reply only (e.g. a safety note); not kept in history
 
         Returns:
             AI response text or None if error
@@ -107,25 +183,40 @@ Be warm, engaging, and professional."""
             self.full_conversation_history.append(user_msg)
 
             # Build messages array with system prompt and history
-            messages = [{"role": "system", "content": self.system_prompt}]
+            messages = list(self.system_messages)
             messages.extend(self.conversation_history)
+            if system_note:
+                messages.append({"role": "system", "content": system_note})
 
-            logger.info(f"Sending message to GPT-5-CHAT (length: {len(user_message)})")
+            logger.info(f"Sending message to GPT-5-CHAT (length: {len(user_message)}, prompt hash: {self.system_prompt_hash})")
             print(f"\n🤖 Thinking...")
 
-            # Call Azure OpenAI with balanced optimization
-            response = self.client.chat.completions.create(
+            request_options = dict(
                 model=self.deployment_name,
-                messages=messages,
                 temperature=temperature,
                 max_tokens=min(max_tokens, 120),  # Allow complete sentences
                 frequency_penalty=0.0,  # Remove penalty that was cutting responses
                 presence_penalty=0.0,   # Remove penalty that was cutting responses
                 stream=False
             )
+            if self.tools:
+                request_options["tools"] = self.tools
+
+            # Call Azure OpenAI with balanced optimization
+            response = self.client.chat.completions.create(messages=messages, **request_options)
+            reply = response.choices[0].message
+
+            # Tool call: run it, then ask for the spoken reply. Only the final
+            # text is kept in history, so trimming never orphans a tool message.
+            if reply.tool_calls and self.tool_handler:
+                messages = self._run_tool_calls(messages, reply)
+                response = self.client.chat.completions.create(
+                    messages=messages, tool_choice="none", **request_options
+                )
+                reply = response.choices[0].message
 
             # Extract assistant response
-            assistant_message = response.choices[0].message.content
+            assistant_message = reply.content
 
             # Add assistant response to BOTH histories
             assistant_msg = {"role": "assistant", "content": assistant_message}
@@ -143,6 +234,20 @@ Be warm, engaging, and professional."""
             print(f"❌ Error: {e}")
             return None
 
+    def record_exchange(self, user_message: str, assistant_message: str):
+        """
+        Add a user/assistant exchange answered without calling the model (e.g. from a cache)
+
+        Args:
+            user_message: User's input message
+            assistant_message: Reply given to the user
+        """
+        for msg in ({"role": "user", "content": user_message},
+                    {"role": "assistant", "content": assistant_message}):
+            self.conversation_history.append(msg)
+            self.full_conversation_history.append(msg)
+        self.trim_conversation_history(max_turns=8)
+
     def chat_stream(self, user_message: str, temperature: float = 0.7, max_tokens: int = 500):
         """
         Send a message and stream the response token by token
@@ -163,10 +268,10 @@ Be warm, engaging, and professional."""
             })
 
             # Build messages array
-            messages = [{"role": "system", "content": self.system_prompt}]
+            messages = list(self.system_messages)
             messages.extend(self.conversation_history)
 
-            logger.info(f"Streaming response for user message (length: {len(user_message)})")
+            logger.info(f"Streaming response for user message (length: {len(user_message)}, prompt hash: {self.system_prompt_hash})")
             print(f"\n🤖 Response: ", end="", flush=True)
 
             # Call Azure OpenAI with streaming
@@ -279,10 +384,7 @@ Please answer the user's question using the context provided above. If the conte
             return "Brief call, no significant content to summarize"
 
         # Build conversation transcript for summarization
-        transcript = "\n".join([
-            f"{'Senior' if msg['role'] == 'user' else 'AI'}: {msg['content']}"
-            for msg in user_messages
-        ])
+        transcript = self._build_transcript(user_messages)
 
         summary_prompt = f"""You are summarizing a wellness check-in call with a senior for medical record purposes.
 
@@ -331,6 +433,53 @@ Detailed Summary:"""
             logger.error(f"Error generating call summary: {e}")
             return f"Call completed with {len(user_messages)} exchanges"
 
+    @staticmethod
+    def _build_transcript(messages: List[Dict[str, str]]) -> str:
+        """Render user/assistant messages as a 'Senior:' / 'AI:' transcript"""
+        return "\n".join([
+            f"{'Senior' if msg['role'] == 'user' else 'AI'}: {msg['content']}"
+            for msg in messages
+        ])
+
+    def generate_cognitive_scores(
+        self, rubric: str, response_format: Dict, messages: Optional[List[Dict]] = None
+    ) -> Optional[str]:
+        """
+        Score the call's cognitive dimensions from the FULL conversation history
+
+        Args:
+            rubric: Scoring instructions (system message)
+            response_format: Structured output schema the reply must match
+            messages: Transcript to score (defaults to full_conversation_history)
+
+        Returns:
+            JSON text matching response_format, or None if the call was too short or scoring failed
+        """
+        if messages is None:
+            messages = self.full_conversation_history
+        user_messages = [msg for msg in messages if msg['role'] in ['user', 'assistant']]
+        if len([msg for msg in user_messages if msg['role'] == 'user']) < 5:
+            return None
+
+        try:
+            response = self.client.chat.completions.create(
+                model=self.deployment_name,
+                messages=[
+                    {"role": "system", "content": rubric},
+                    {"role": "user", "content": self._build_transcript(user_messages)}
+                ],
+                response_format=response_format,
+                temperature=0.0,
+                max_tokens=300
+            )
+            scores = response.choices[0].message.content
+            logger.info("Generated cognitive scores")
+            return scores
+
+        except Exception as e:
+            logger.error(f"Error generating cognitive scores: {e}")
+            return None
+
     def save_conversation(self) -> List[Dict[str, str]]:
         """
         Get conversation history for saving to database
@@ -39,6 +39,13 @@ class SeniorProfileService:
             logger.info(f"Seniors container not found, will need to be created")
             self.container = None
 
+    def close(self):
+        """Close the underlying Cosmos DB client and its HTTP sessions"""
+        if self.client:
+            # The sync CosmosClient releases its transport via the context manager protocol
+            self.client.__exit__(None, None, None)
+            self.client = None
+
     def create_container(self):
         """Create the seniors container if it doesn't exist"""
         try:
@@ -34,6 +34,41 @@ class SafetyCategory(Enum):
     SCAM_ATTEMPT = "scam_attempt"
 
 
+# Response the model must give when a user message is flagged. Detection is
+# done here, so the system prompt only carries a short safety reminder.
+SAFETY_RESPONSE_GUIDANCE = {
+    SafetyCategory.EMERGENCY_MEDICAL.value: (
+        "Possible medical emergency. Say: \"This is an emergency. I need you to call 911 right now, "
+        "or I can connect you with emergency services.\" Stay calm, reassuring and on the line."
+    ),
+    SafetyCategory.SUICIDE_RISK.value: (
+        "Possible suicide or self-harm risk. Take it seriously and never dismiss it. Say: \"I'm really "
+        "concerned about you.\" Tell them the 988 Suicide & Crisis Lifeline is available 24/7 - just dial 988 - "
+        "ask if there is family or a friend you can help them contact, and keep the conversation going."
+    ),
+    SafetyCategory.ABUSE_PHYSICAL.value: (
+        "Possible abuse. Listen with empathy and belief. Say: \"What you're describing concerns me. You deserve "
+        "to be safe and treated with respect.\" Ask: \"Would it be okay if someone who can help reached out to you?\""
+    ),
+    SafetyCategory.ABUSE_EMOTIONAL.value: (
+        "Possible emotional abuse. Believe them and never minimize it. Say: \"You deserve to be treated with "
+        "respect.\" Ask if it would be okay for someone who can help to reach out."
+    ),
+    SafetyCategory.ABUSE_FINANCIAL.value: (
+        "Possible financial exploitation. Believe them, do not discuss money details, and ask if it would be "
+        "okay for someone who can help to reach out. Suggest involving trusted family."
+    ),
+    SafetyCategory.NEGLECT.value: (
+        "Possible neglect (food, medication or basic care). Ask gently about their situation and whether "
+        "someone can help them today; offer to have their care team follow up."
+    ),
+    SafetyCategory.MEDICATION_ISSUE.value: (
+        "Medication concern. Do not advise on doses. Say: \"Please tell your doctor or pharmacist about that\" "
+        "and, if they took too much, urge them to call their doctor or Poison Control (1-800-222-1222) now."
+    ),
+}
+
+
 class SafetyMonitor:
     """Monitors conversations for safety concerns"""
 
@@ -55,7 +90,8 @@ class SafetyMonitor:
             r"\b(want to die|wish I was dead|kill myself|end my life|suicide)\b",
             r"\b(better off dead|no reason to live|life isn'?t worth living)\b",
             r"\b(hurt myself|harm myself|cut myself)\b",
-            r"\b(made a plan to|wrote a note|saying goodbye)\b"
+            r"\b(made a plan to|wrote a note|saying goodbye)\b",
+            r"\b(wish I (?:weren'?t|wasn'?t) here|don'?t want to be here anymore)\b"
         ]
 
         # Physical abuse keywords
@@ -76,7 +112,7 @@ class SafetyMonitor:
 
         # Financial exploitation keywords
         self.abuse_financial_patterns = [
-            r"\b(taking my money|stole from me|forged my signature)\b",
+            r"\b(taking my money|took my money|takes my money|stole from me|forged my signature)\b",
             r"\b(won'?t give me my money|controls all my money)\b",
             r"\b(forced me to sign|tricked me into signing)\b",
             r"\b(emptied my account|unauthorized charges)\b"
@@ -87,7 +123,8 @@ class SafetyMonitor:
             r"\b(no food|nothing to eat|haven'?t eaten|starving)\b",
             r"\b(no medication|can'?t get medication|out of medication)\b",
             r"\b(dirty|unsanitary|no clean clothes|smell bad)\b",
-            r"\b(alone all day|no one checks|abandoned me)\b"
+            r"\b(alone all day|no one checks|abandoned me)\b",
+            r"\b(won'?t let me (?:leave|go out)|locks me in|locked me in)\b"
         ]
 
         # Medication safety issues
@@ -98,6 +135,18 @@ class SafetyMonitor:
             r"\b(mixing|combined with|took with alcohol)\b"
         ]
 
+        # Patterns that should NEVER appear in AI responses
+        self.harmful_advice_patterns = [
+            (r"\b(stop taking|don'?t take|skip).*(medication|medicine|pills)\b", "Advising to stop medication"),
+            (r"\b(try|take|use).*(this medication|these pills)\b(?!.*doctor)", "Recommending medication"),
+            (r"\b(invest|buy|purchase|donate).*(money|funds)\b", "Financial advice"),
+            (r"\byou should (hurt|harm)\b", "Suggesting harm"),
+            (r"\bkeep (this|it|that) (secret|between us|private)\b", "Asking to keep secrets"),
+            (r"\b(don'?t tell|don'?t mention).*(doctor|family|caregiver)\b", "Discouraging disclosure"),
+            (r"\b(you'?re|they'?re) (overreacting|imagining|being dramatic)\b", "Invalidating concerns"),
+            (r"\bignore (the pain|symptoms|doctor)\b", "Advising to ignore medical issues")
+        ]
+
         # Compile all patterns
         self._compile_patterns()
 
@@ -112,6 +161,18 @@ class SafetyMonitor:
         self.abuse_financial_regex = [re.compile(p, re.IGNORECASE) for p in self.abuse_financial_patterns]
         self.neglect_regex = [re.compile(p, re.IGNORECASE) for p in self.neglect_patterns]
         self.medication_regex = [re.compile(p, re.IGNORECASE) for p in self.medication_patterns]
+        self.harmful_advice_regex = [
+            (re.compile(p, re.IGNORECASE), issue) for p, issue in self.harmful_advice_patterns
+        ]
+
+        # One pass over the message to rule out every category at once; most
+        # messages match nothing, so the per-pattern checks below are skipped
+        all_patterns = (
+            self.emergency_medical_patterns + self.suicide_patterns + self.abuse_physical_patterns +
+            self.abuse_emotional_patterns + self.abuse_financial_patterns + self.neglect_patterns +
+            self.medication_patterns
+        )
+        self.any_concern_regex = re.compile("|".join(f"(?:{p})" for p in all_patterns), re.IGNORECASE)
 
     def analyze_message(self, message: str, role: str = "user") -> Dict:
         """
@@ -134,68 +195,70 @@ class SafetyMonitor:
             "timestamp": datetime.utcnow().isoformat()
         }
 
-        # Check for emergency medical situations
-        for pattern in self.emergency_medical_regex:
-            if pattern.search(message):
-                result["alert_level"] = AlertLevel.EMERGENCY.value
-                result["categories"].append(SafetyCategory.EMERGENCY_MEDICAL.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "CALL 911 IMMEDIATELY - Medical emergency detected"
-
-        # Check for suicide/self-harm
-        for pattern in self.suicide_regex:
-            if pattern.search(message):
-                if result["alert_level"] != AlertLevel.EMERGENCY.value:
+        # Quick reject: no category pattern anywhere in the message
+        if self.any_concern_regex.search(message):
+            # Check for emergency medical situations
+            for pattern in self.emergency_medical_regex:
+                if pattern.search(message):
                     result["alert_level"] = AlertLevel.EMERGENCY.value
-                result["categories"].append(SafetyCategory.SUICIDE_RISK.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "MENTAL HEALTH CRISIS - Contact 988 Suicide & Crisis Lifeline"
-
-        # Check for physical abuse
-        for pattern in self.abuse_physical_regex:
-            if pattern.search(message):
-                if result["alert_level"] not in [AlertLevel.EMERGENCY.value]:
-                    result["alert_level"] = AlertLevel.URGENT.value
-                result["categories"].append(SafetyCategory.ABUSE_PHYSICAL.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "ABUSE ALERT - Contact Adult Protective Services"
-
-        # Check for emotional abuse
-        for pattern in self.abuse_emotional_regex:
-            if pattern.search(message):
-                if result["alert_level"] == AlertLevel.NONE.value:
-                    result["alert_level"] = AlertLevel.URGENT.value
-                result["categories"].append(SafetyCategory.ABUSE_EMOTIONAL.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "ABUSE ALERT - Contact Adult Protective Services"
-
-        # Check for financial exploitation
-        for pattern in self.abuse_financial_regex:
-            if pattern.search(message):
-                if result["alert_level"] == AlertLevel.NONE.value:
-                    result["alert_level"] = AlertLevel.URGENT.value
-                result["categories"].append(SafetyCategory.ABUSE_FINANCIAL.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "FINANCIAL EXPLOITATION - Contact Adult Protective Services and local police"
-
-        # Check for neglect
-        for pattern in self.neglect_regex:
-            if pattern.search(message):
-                if result["alert_level"] == AlertLevel.NONE.value:
-                    result["alert_level"] = AlertLevel.URGENT.value
-                result["categories"].append(SafetyCategory.NEGLECT.value)
-                result["matched_patterns"].append(pattern.pattern)
-                result["recommended_action"] = "NEGLECT ALERT - Contact Adult Protective Services"
-
-        # Check for medication issues
-        for pattern in self.medication_regex:
-            if pattern.search(message):
-                if result["alert_level"] == AlertLevel.NONE.value:
-                    result["alert_level"] = AlertLevel.WARNING.value
-                result["categories"].append(SafetyCategory.MEDICATION_ISSUE.value)
-                result["matched_patterns"].append(pattern.pattern)
-                if result["recommended_action"] is None:
-                    result["recommended_action"] = "MEDICATION CONCERN - Contact healthcare provider"
+                    result["categories"].append(SafetyCategory.EMERGENCY_MEDICAL.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "CALL 911 IMMEDIATELY - Medical emergency detected"
+
+            # Check for suicide/self-harm
+            for pattern in self.suicide_regex:
+                if pattern.search(message):
+                    if result["alert_level"] != AlertLevel.EMERGENCY.value:
+                        result["alert_level"] = AlertLevel.EMERGENCY.value
+                    result["categories"].append(SafetyCategory.SUICIDE_RISK.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "MENTAL HEALTH CRISIS - Contact 988 Suicide & Crisis Lifeline"
+
+            # Check for physical abuse
+            for pattern in self.abuse_physical_regex:
+                if pattern.search(message):
+                    if result["alert_level"] not in [AlertLevel.EMERGENCY.value]:
+                        result["alert_level"] = AlertLevel.URGENT.value
+                    result["categories"].append(SafetyCategory.ABUSE_PHYSICAL.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "ABUSE ALERT - Contact Adult Protective Services"
+
+            # Check for emotional abuse
+            for pattern in self.abuse_emotional_regex:
+                if pattern.search(message):
+                    if result["alert_level"] == AlertLevel.NONE.value:
+                        result["alert_level"] = AlertLevel.URGENT.value
+                    result["categories"].append(SafetyCategory.ABUSE_EMOTIONAL.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "ABUSE ALERT - Contact Adult Protective Services"
+
+            # Check for financial exploitation
+            for pattern in self.abuse_financial_regex:
+                if pattern.search(message):
+                    if result["alert_level"] == AlertLevel.NONE.value:
+                        result["alert_level"] = AlertLevel.URGENT.value
+                    result["categories"].append(SafetyCategory.ABUSE_FINANCIAL.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "FINANCIAL EXPLOITATION - Contact Adult Protective Services and local police"
+
+            # Check for neglect
+            for pattern in self.neglect_regex:
+                if pattern.search(message):
+                    if result["alert_level"] == AlertLevel.NONE.value:
+                        result["alert_level"] = AlertLevel.URGENT.value
+                    result["categories"].append(SafetyCategory.NEGLECT.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    result["recommended_action"] = "NEGLECT ALERT - Contact Adult Protective Services"
+
+            # Check for medication issues
+            for pattern in self.medication_regex:
+                if pattern.search(message):
+                    if result["alert_level"] == AlertLevel.NONE.value:
+                        result["alert_level"] = AlertLevel.WARNING.value
+                    result["categories"].append(SafetyCategory.MEDICATION_ISSUE.value)
+                    result["matched_patterns"].append(pattern.pattern)
+                    if result["recommended_action"] is None:
+                        result["recommended_action"] = "MEDICATION CONCERN - Contact healthcare provider"
 
         # Check AI responses for harmful advice (if assistant message)
         if role == "assistant":
@@ -220,20 +283,8 @@ class SafetyMonitor:
         """
         issues = []
 
-        # Patterns that should NEVER appear in AI responses
-        dangerous_patterns = [
-            (r"\b(stop taking|don'?t take|skip).*(medication|medicine|pills)\b", "Advising to stop medication"),
-            (r"\b(try|take|use).*(this medication|these pills)\b(?!.*doctor)", "Recommending medication"),
-            (r"\b(invest|buy|purchase|donate).*(money|funds)\b", "Financial advice"),
-            (r"\byou should (hurt|harm)\b", "Suggesting harm"),
-            (r"\bkeep (this|it|that) (secret|between us|private)\b", "Asking to keep secrets"),
-            (r"\b(don'?t tell|don'?t mention).*(doctor|family|caregiver)\b", "Discouraging disclosure"),
-            (r"\b(you'?re|they'?re) (overreacting|imagining|being dramatic)\b", "Invalidating concerns"),
-            (r"\bignore (the pain|symptoms|doctor)\b", "Advising to ignore medical issues")
-        ]
-
-        for pattern, issue_description in dangerous_patterns:
-            if re.search(pattern, message, re.IGNORECASE):
+        for pattern, issue_description in self.harmful_advice_regex:
+            if pattern.search(message):
                 issues.append(issue_description)
 
         return {
@@ -295,6 +346,27 @@ class SafetyMonitor:
 
         return conversation_analysis
 
+    def get_response_guidance(self, analysis: Optional[Dict]) -> Optional[str]:
+        """
+        Build the SAFETY NOTE sent to the model with a flagged user message
+
+        Args:
+            analysis: Result of analyze_message for the senior's message
+
+        Returns:
+            Guidance text, or None if nothing was flagged
+        """
+        if not analysis or analysis["role"] != "user" or not analysis["categories"]:
+            return None
+
+        guidance = []
+        for category in dict.fromkeys(analysis["categories"]):  # de-duplicated, detection order
+            if category in SAFETY_RESPONSE_GUIDANCE:
+                guidance.append(SAFETY_RESPONSE_GUIDANCE[category])
+        if not guidance:
+            return None
+        return "SAFETY NOTE (from the safety monitor, about the senior's last message):\n" + "\n".join(guidance)
+
     def get_crisis_resources(self) -> Dict[str, str]:
         """
         Get crisis resources contact information
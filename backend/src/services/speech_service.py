@@ -3,7 +3,8 @@ Azure Speech Services integration
 Handles Speech-to-Text (STT) and Text-to-Speech (TTS)
 """
 import azure.cognitiveservices.speech as speechsdk
-from typing import Optional
+from collections import OrderedDict
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,9 @@ logger = logging.getLogger(__name__)
 class SpeechService:
     """Manages Azure Speech Services for STT and TTS"""
 
+    # Max number of fixed phrases (greetings, prompts, farewells) kept as audio
+    AUDIO_CACHE_SIZE = 32
+
     def __init__(self, speech_key: str, speech_region: str, voice_name: str = "en-US-JennyNeural"):
         """
         Initialize Speech Service
@@ -48,6 +52,9 @@ class SpeechService:
             "TrueText"  # Enables profanity filtering and improved punctuation
         )
 
+        # Synthesized audio for fixed phrases, keyed by (voice_name, text)
+        self._audio_cache: "OrderedDict[Tuple[str, str], bytes]" = OrderedDict()
+
         logger.info(f"Speech Service initialized with voice: {self.voice_name} (noise suppression enabled)")
 
     def recognize_from_microphone(self) -> Optional[str]:
@@ -275,6 +282,31 @@ class SpeechService:
             logger.error(f"Error during speech synthesis to audio data: {e}")
             return None
 
+    def synthesize_cached_audio_data(self, text: str) -> Optional[bytes]:
+        """
+        Same as synthesize_to_audio_data, but reuses audio for text already
+        synthesized with the current voice. Use for fixed phrases only.
+
+        Args:
+            text: Text to convert to speech
+
+        Returns:
+            Raw audio bytes (WAV format) or None if synthesis failed
+        """
+        key = (self.voice_name, text)
+        audio_data = self._audio_cache.get(key)
+        if audio_data is not None:
+            self._audio_cache.move_to_end(key)
+            logger.info(f"Using cached speech audio ({len(audio_data)} bytes)")
+            return audio_data
+
+        audio_data = self.synthesize_to_audio_data(text)
+        if audio_data:
+            self._audio_cache[key] = audio_data
+            if len(self._audio_cache) > self.AUDIO_CACHE_SIZE:
+                self._audio_cache.popitem(last=False)
+        return audio_data
+
     def set_voice(self, voice_name: str):
         """
         Change the voice used for speech synthesis
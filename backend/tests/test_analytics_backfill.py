@@ -0,0 +1,62 @@
+"""
+Multiprocess analytics backfill with a stubbed PostgreSQL connection pool
+"""
+import multiprocessing
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("psycopg2")
+
+from src.services import analytics_sync_service
+from src.services.analytics_sync_service import AnalyticsSyncService, backfill_sessions
+
+# The stubs are patched in the parent and reach the workers by fork
+pytestmark = pytest.mark.skipif(
+    multiprocessing.get_start_method() != 'fork',
+    reason="stubbed pool is inherited by forked workers only"
+)
+
+
+class _StubConnection:
+    closed = 0
+
+
+class _StubPool:
+    """Stands in for ThreadedConnectionPool; no database is contacted"""
+
+    def getconn(self):
+        return _StubConnection()
+
+    def putconn(self, conn, close=False):
+        pass
+
+
+def _session(index):
+    return {
+        'sessionId': f'session-{index}',
+        'createdAt': '2026-10-16T10:00:00Z',
+        'metadata': {'senior_id': 'senior-1'},
+        'messages': [
+            {'role': 'user', 'content': 'My blood pressure was 120/80 this morning'},
+            {'role': 'assistant', 'content': 'Thanks for checking it.'},
+        ],
+    }
+
+
+@pytest.fixture
+def stub_pool(monkeypatch):
+    monkeypatch.setattr(analytics_sync_service, '_get_pool', lambda max_connections: _StubPool())
+    # Every session in a batch counts as newly inserted
+    monkeypatch.setattr(AnalyticsSyncService, '_write_batch', lambda self, conn, built: set(built))
+
+
+def test_backfill_syncs_every_chunk(stub_pool):
+    sessions = [_session(i) for i in range(10)]
+    assert backfill_sessions(sessions, processes=2, chunk_size=3) == 10
+
+
+def test_backfill_without_sessions_starts_no_workers(stub_pool):
+    assert backfill_sessions([]) == 0
@@ -0,0 +1,49 @@
+"""
+Off-topic detection for the REDIRECT NOTE
+Ordinary check-in answers must stay on topic; real off-topic requests must not
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.senior_health_prompt import classify_topic
+
+
+@pytest.mark.parametrize("utterance", [
+    "My daughter Sue visited me yesterday",
+    "Should I take a walk after lunch?",
+    "Should I take my blood pressure now?",
+    "I watched the stocks report on TV",
+    "I slept about seven hours last night",
+    "I went to my religious group at church this morning",
+    "I try to be conservative with salt",
+    "My grandson is president of his class",
+    "My son is a lawyer and visited Sunday",
+    "My phone keeps ringing with my grandkids",
+    "Can you call me tomorrow at the same time?",
+    "I heard on the news it will snow, so I stayed in",
+])
+def test_check_in_answers_stay_on_topic(utterance):
+    assert classify_topic(utterance) is None
+
+
+@pytest.mark.parametrize("utterance, topic", [
+    ("I want to sue them for what they did", "legal"),
+    ("Should I take my medication twice today?", "medical_advice"),
+    ("Should I skip my evening pills?", "medical_advice"),
+    ("Should I double the dose?", "medical_advice"),
+    ("Should I take 500mg of tylenol?", "medical_advice"),
+    ("Is now a good time to invest in bitcoin?", "finance"),
+    ("What do you think about the stock market?", "finance"),
+    ("What do you think about the election?", "politics"),
+    ("Who should I vote for?", "politics"),
+    ("Do I need a lawyer for this?", "legal"),
+    ("Can you help me with my phone?", "technology"),
+    ("How do I reset my wifi password?", "technology"),
+    ("Can you call my daughter for me?", "tasks"),
+    ("Did you see the news today?", "news"),
+])
+def test_off_topic_requests_are_classified(utterance, topic):
+    assert classify_topic(utterance) == topic
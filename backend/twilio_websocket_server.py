@@ -269,15 +269,21 @@ def normalize_tts_text(text: str) -> str:
 
     return text
 
-async def send_audio_to_twilio(websocket: WebSocket, stream_sid: str, audio_text: str):
-    """Generate speech using Azure TTS and send to Twilio via WebSocket"""
+async def send_audio_to_twilio(websocket: WebSocket, stream_sid: str, audio_text: str, cache_audio: bool = False):
+    """
+    Generate speech using Azure TTS and send to Twilio via WebSocket
+    Set cache_audio for fixed phrases (greetings, prompts) to reuse earlier synthesis
+    """
     try:
         # Normalize text for natural speech (remove excessive emphasis)
         normalized_text = normalize_tts_text(audio_text)
 
         # Generate speech using agent's speech service (Sara voice at 1.1x speed)
         logger.info(f"Generating Azure TTS for text (length: {len(normalized_text)})")
-        wav_data = agent.speech.synthesize_to_audio_data(normalized_text)
+        if cache_audio:
+            wav_data = agent.speech.synthesize_cached_audio_data(normalized_text)
+        else:
+            wav_data = agent.speech.synthesize_to_audio_data(normalized_text)
 
         if not wav_data:
             logger.error("Failed to generate Azure TTS audio")
@@ -553,6 +559,7 @@ async def media_stream(websocket: WebSocket):
     SPEECH_CHUNKS_REQUIRED = max(1, VAD_SUSTAINED_CHUNKS)
     no_response_attempts = 0  # Track how many times we've asked user to respond
     MAX_NO_RESPONSE_ATTEMPTS = 3  # End call after 3 failed prompts
+    user_turns = 0  # Caller turns answered (drives the phased prompt and first-turn cache)
 
     # Adaptive noise floor learning - ENABLED to handle variable phone audio levels
     ambient_noise_samples = []
@@ -582,7 +589,6 @@ async def media_stream(websocket: WebSocket):
 
                 # Initialize session when stream starts (same as original working version)
                 from src.services.profile_service import SeniorProfileService
-                from src.senior_health_prompt import SENIOR_HEALTH_SYSTEM_PROMPT
 
                 # Look up senior profile
                 senior_name = None
@@ -632,15 +638,9 @@ async def media_stream(websocket: WebSocket):
                 logger.info(f"⏱️ [{time.time() - start_time:.2f}s] Session started")
                 logger.info(f"Started session {agent.current_session_id}")
 
-                # Update system prompt with senior's name
+                # Static prompt + this senior's name, history and reminders
                 ai_name = config.get_ai_name()
-                if senior_name:
-                    personalized_prompt = SENIOR_HEALTH_SYSTEM_PROMPT.replace("[Name]", senior_name).replace("[Your AI Name]", ai_name)
-                    personalized_prompt += f"\n\nREMINDER: The senior's name is {senior_name}. Always use their actual name, never use placeholders like [Name]."
-                    agent.openai.set_system_prompt(personalized_prompt)
-                else:
-                    generic_prompt = SENIOR_HEALTH_SYSTEM_PROMPT.replace("[Name]", "them").replace("[Your AI Name]", ai_name)
-                    agent.openai.set_system_prompt(generic_prompt)
+                agent._apply_call_prompt(senior_name, ai_name)
 
                 logger.info(f"⏱️ [{time.time() - start_time:.2f}s] System prompt set")
 
@@ -659,7 +659,8 @@ async def media_stream(websocket: WebSocket):
                 if not greeting_sent and greeting:
                     agent_is_speaking = True
                     logger.info(f"⏱️ [{time.time() - start_time:.2f}s] Starting TTS generation...")
-                    await send_audio_to_twilio(websocket, stream_sid, greeting)
+                    # Only the nameless greeting is shared across callers
+                    await send_audio_to_twilio(websocket, stream_sid, greeting, cache_audio=not senior_name)
                     logger.info(f"⏱️ [{time.time() - start_time:.2f}s] TTS sent to Twilio")
                     greeting_sent = True
                     # Wait a bit for greeting to finish playing, then allow user input
@@ -759,7 +760,7 @@ async def media_stream(websocket: WebSocket):
                                 # End call after 3 attempts
                                 goodbye_msg = "I'm having trouble hearing you. Let's try again another time. Goodbye!"
                                 logger.info("Ending call due to no response")
-                                await send_audio_to_twilio(websocket, stream_sid, goodbye_msg)
+                                await send_audio_to_twilio(websocket, stream_sid, goodbye_msg, cache_audio=True)
                                 await asyncio.sleep(3)
                                 break
                             else:
@@ -767,7 +768,7 @@ async def media_stream(websocket: WebSocket):
                                 prompt_msg = "I'm sorry, I didn't catch that. Could you please speak a bit louder?"
                                 logger.info("Prompting user to speak louder")
                                 agent_is_speaking = True
-                                await send_audio_to_twilio(websocket, stream_sid, prompt_msg)
+                                await send_audio_to_twilio(websocket, stream_sid, prompt_msg, cache_audio=True)
                                 agent_is_speaking = False
                                 silence_counter = 0  # Reset after prompting
                                 # After prompt, add cooldown and delay before next prompt
@@ -802,12 +803,14 @@ async def media_stream(websocket: WebSocket):
                         logger.info("Caller speech transcribed (content suppressed)")
 
                         # Save user message
-                        agent.save_message("user", transcribed_text)
+                        safety_analysis = agent.save_message("user", transcribed_text)
 
                         # Get AI response (same as local - uses OpenAI with full context)
-                        ai_response = agent.openai.chat(
-                            user_message=transcribed_text,
-                            temperature=0.7,
+                        user_turns += 1
+                        ai_response, _ = agent._get_ai_response(
+                            transcribed_text,
+                            user_turns,
+                            safety_analysis,
                             max_tokens=150
                         )
 